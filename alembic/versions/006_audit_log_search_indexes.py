@@ -0,0 +1,48 @@
+"""audit_log_search_indexes
+
+Revision ID: 006_audit_log_search_indexes
+Revises: 005_workflow_tables
+Create Date: 2026-10-18
+
+Adds pg_trgm GIN indexes on the audit_log columns the admin log viewer
+filters with ILIKE '%x%' (user_email, search_query, action, target_resource,
+ip_address). Plain B-tree indexes cannot serve infix patterns, so those
+filters previously sequential-scanned the whole table. The queries in
+PostgresAuditService are unchanged; the planner picks these indexes up for
+the existing .ilike() predicates.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "006_audit_log_search_indexes"
+down_revision: Union[str, None] = "005_workflow_tables"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TRGM_COLUMNS = (
+    "user_email",
+    "search_query",
+    "action",
+    "target_resource",
+    "ip_address",
+)
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for column in TRGM_COLUMNS:
+        op.create_index(
+            f"ix_audit_log_{column}_trgm",
+            "audit_log",
+            [column],
+            postgresql_using="gin",
+            postgresql_ops={column: "gin_trgm_ops"},
+        )
+
+
+def downgrade() -> None:
+    # pg_trgm is left installed; other objects may depend on it.
+    for column in reversed(TRGM_COLUMNS):
+        op.drop_index(f"ix_audit_log_{column}_trgm", table_name="audit_log")
@@ -0,0 +1,42 @@
+"""audit_log_prefix_indexes
+
+Revision ID: 007_audit_log_prefix_indexes
+Revises: 006_audit_log_search_indexes
+Create Date: 2026-10-18
+
+Adds lower(...) text_pattern_ops expression indexes on audit_log.user_email
+and audit_log.ip_address. The default B-tree operator class cannot serve
+LIKE, so prefix filters from the admin log viewer (e.g. ip_address "10.%")
+fell back to the trigram indexes or a sequential scan. PostgresAuditService
+rewrites single-trailing-% filters to lower(column) LIKE 'prefix%', which
+these indexes answer with a range scan.
+
+Expression indexes are not reflected by autogenerate, so they are managed
+here rather than declared on the AuditLog model.
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "007_audit_log_prefix_indexes"
+down_revision: Union[str, None] = "006_audit_log_search_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PREFIX_COLUMNS = ("user_email", "ip_address")
+
+
+def upgrade() -> None:
+    for column in PREFIX_COLUMNS:
+        op.create_index(
+            f"ix_audit_log_{column}_lower_prefix",
+            "audit_log",
+            [sa.text(f"lower({column}) text_pattern_ops")],
+        )
+
+
+def downgrade() -> None:
+    for column in reversed(PREFIX_COLUMNS):
+        op.drop_index(f"ix_audit_log_{column}_lower_prefix", table_name="audit_log")
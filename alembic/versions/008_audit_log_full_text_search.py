@@ -0,0 +1,52 @@
+"""audit_log_full_text_search
+
+Revision ID: 008_audit_log_full_text_search
+Revises: 007_audit_log_prefix_indexes
+Create Date: 2026-10-18
+
+Adds a stored generated tsvector column (search_tsv) over audit_log's
+search_query, action and target_resource, plus a GIN index on it. The admin
+log viewer's multi-word free-text search matches it with plainto_tsquery
+instead of OR-ing three ILIKE '%x%' predicates.
+
+NOTE: adding a STORED generated column rewrites audit_log and holds an
+ACCESS EXCLUSIVE lock for the duration; schedule on large installs.
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "008_audit_log_full_text_search"
+down_revision: Union[str, None] = "007_audit_log_prefix_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "audit_log",
+        sa.Column(
+            "search_tsv",
+            postgresql.TSVECTOR(),
+            sa.Computed(
+                "to_tsvector('simple', coalesce(search_query, '') || ' ' || "
+                "coalesce(action, '') || ' ' || coalesce(target_resource, ''))",
+                persisted=True,
+            ),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        "ix_audit_log_search_tsv",
+        "audit_log",
+        ["search_tsv"],
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_audit_log_search_tsv", table_name="audit_log")
+    op.drop_column("audit_log", "search_tsv")
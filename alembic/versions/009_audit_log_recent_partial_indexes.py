@@ -0,0 +1,56 @@
+"""audit_log_recent_partial_indexes
+
+Revision ID: 009_audit_log_recent_partial_indexes
+Revises: 008_audit_log_full_text_search
+Create Date: 2026-10-18
+
+Adds partial indexes on audit_log (created_at DESC) for the hot per-event-type
+listings: event_type='search' (get_recent_searches, get_search_statistics,
+search-filtered query_logs), 'config' (get_config_changes) and 'error'
+(error dashboards). The search index INCLUDEs the dashboard columns so those
+reads can be served by an index-only scan. No query changes are needed; the
+planner matches the WHERE predicates automatically.
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "009_audit_log_recent_partial_indexes"
+down_revision: Union[str, None] = "008_audit_log_full_text_search"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_audit_log_search_recent",
+        "audit_log",
+        [sa.text("created_at DESC")],
+        postgresql_where=sa.text("event_type = 'search'"),
+        postgresql_include=[
+            "user_email",
+            "search_query",
+            "search_results_count",
+            "success",
+        ],
+    )
+    op.create_index(
+        "ix_audit_log_config_recent",
+        "audit_log",
+        [sa.text("created_at DESC")],
+        postgresql_where=sa.text("event_type = 'config'"),
+    )
+    op.create_index(
+        "ix_audit_log_error_recent",
+        "audit_log",
+        [sa.text("created_at DESC")],
+        postgresql_where=sa.text("event_type = 'error'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_audit_log_error_recent", table_name="audit_log")
+    op.drop_index("ix_audit_log_config_recent", table_name="audit_log")
+    op.drop_index("ix_audit_log_search_recent", table_name="audit_log")
@@ -0,0 +1,34 @@
+"""audit_log_user_email_skip_scan
+
+Revision ID: 010_audit_log_user_email_skip_scan
+Revises: 009_audit_log_recent_partial_indexes
+Create Date: 2026-10-18
+
+Adds a partial btree index on audit_log (user_email) excluding the 'system'
+account. get_users_with_activity walks it with a recursive-CTE skip scan (one
+index seek per distinct user) instead of a full-table DISTINCT, and the
+partial predicate keeps the high-volume system rows out of the index.
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "010_audit_log_user_email_skip_scan"
+down_revision: Union[str, None] = "009_audit_log_recent_partial_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_audit_log_user_email_not_system",
+        "audit_log",
+        ["user_email"],
+        postgresql_where=sa.text("user_email <> 'system'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_audit_log_user_email_not_system", table_name="audit_log")
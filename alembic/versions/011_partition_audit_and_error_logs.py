@@ -0,0 +1,144 @@
+"""partition_audit_and_error_logs
+
+Revision ID: 011_partition_audit_and_error_logs
+Revises: 010_audit_log_user_email_skip_scan
+Create Date: 2026-10-18
+
+Converts audit_log and error_log into tables range-partitioned by month on
+created_at, so the day-window reports (created_at >= cutoff) only touch the
+partitions inside the window and old months can be detached for archival.
+
+Each table is rebuilt in place: the original is renamed aside, a partitioned
+copy is created with the same columns, defaults and generated columns, one
+partition per month is created from the oldest row through next month (plus a
+DEFAULT partition as a catch-all), rows are copied across and the original
+indexes are recreated on the new parent. The primary key becomes
+(id, created_at) because PostgreSQL requires unique constraints on a
+partitioned table to include the partition key; ids still come from the same
+sequence. Future months are created ahead of time by AuditPartitionService.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "011_partition_audit_and_error_logs"
+down_revision: Union[str, None] = "010_audit_log_user_email_skip_scan"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PARTITIONED_TABLES = ("audit_log", "error_log")
+
+# Copy rows and indexes from {old} to {new}; generated columns are skipped in
+# the copy because PostgreSQL recomputes them on insert.
+_COPY_ROWS_AND_INDEXES = """
+    cols := (
+        SELECT string_agg(quote_ident(column_name), ', ' ORDER BY ordinal_position)
+        FROM information_schema.columns
+        WHERE table_schema = current_schema()
+          AND table_name = '{old}'
+          AND is_generated = 'NEVER'
+    );
+    EXECUTE format('INSERT INTO {new} (%s) SELECT %s FROM {old}', cols, cols);
+
+    index_defs := ARRAY(
+        SELECT indexdef
+        FROM pg_indexes
+        WHERE schemaname = current_schema()
+          AND tablename = '{old}'
+          AND indexname <> '{old}_pkey'
+    );
+    DROP TABLE {old};
+    FOREACH index_def IN ARRAY index_defs LOOP
+        -- pg_indexes renders "ON [ONLY] schema.table"; a plain ON on the new
+        -- parent also builds the index on every partition
+        EXECUTE replace(
+            replace(index_def, ' ON ONLY ', ' ON '),
+            format(' ON %I.{old} ', current_schema()),
+            format(' ON %I.{new} ', current_schema())
+        );
+    END LOOP;
+"""
+
+_PARTITION_TABLE = """
+DO $$
+DECLARE
+    cols text;
+    index_defs text[];
+    index_def text;
+    month date;
+    last_month date;
+BEGIN
+    ALTER TABLE {table} RENAME TO {table}_unpartitioned;
+    ALTER TABLE {table}_unpartitioned
+        RENAME CONSTRAINT {table}_pkey TO {table}_unpartitioned_pkey;
+    ALTER SEQUENCE {table}_id_seq OWNED BY NONE;
+
+    CREATE TABLE {table} (
+        LIKE {table}_unpartitioned
+        INCLUDING DEFAULTS INCLUDING GENERATED INCLUDING CONSTRAINTS
+    ) PARTITION BY RANGE (created_at);
+    ALTER TABLE {table} ADD CONSTRAINT {table}_pkey PRIMARY KEY (id, created_at);
+    ALTER SEQUENCE {table}_id_seq OWNED BY {table}.id;
+    CREATE TABLE {table}_default PARTITION OF {table} DEFAULT;
+
+    month := date_trunc(
+        'month', coalesce((SELECT min(created_at) FROM {table}_unpartitioned), now())
+    )::date;
+    last_month := (date_trunc('month', now()) + interval '1 month')::date;
+    WHILE month <= last_month LOOP
+        EXECUTE format(
+            'CREATE TABLE %I PARTITION OF {table} FOR VALUES FROM (%L) TO (%L)',
+            '{table}_p' || to_char(month, 'YYYY_MM'),
+            month,
+            (month + interval '1 month')::date
+        );
+        month := (month + interval '1 month')::date;
+    END LOOP;
+{copy}
+END $$
+"""
+
+_UNPARTITION_TABLE = """
+DO $$
+DECLARE
+    cols text;
+    index_defs text[];
+    index_def text;
+BEGIN
+    ALTER TABLE {table} RENAME TO {table}_partitioned;
+    ALTER TABLE {table}_partitioned
+        RENAME CONSTRAINT {table}_pkey TO {table}_partitioned_pkey;
+    ALTER SEQUENCE {table}_id_seq OWNED BY NONE;
+
+    CREATE TABLE {table} (
+        LIKE {table}_partitioned
+        INCLUDING DEFAULTS INCLUDING GENERATED INCLUDING CONSTRAINTS
+    );
+    ALTER TABLE {table} ADD CONSTRAINT {table}_pkey PRIMARY KEY (id);
+    ALTER SEQUENCE {table}_id_seq OWNED BY {table}.id;
+{copy}
+END $$
+"""
+
+
+def _copy(old: str, new: str) -> str:
+    return _COPY_ROWS_AND_INDEXES.format(old=old, new=new)
+
+
+def upgrade() -> None:
+    for table in PARTITIONED_TABLES:
+        op.execute(
+            _PARTITION_TABLE.format(
+                table=table, copy=_copy(f"{table}_unpartitioned", table)
+            )
+        )
+
+
+def downgrade() -> None:
+    for table in reversed(PARTITIONED_TABLES):
+        op.execute(
+            _UNPARTITION_TABLE.format(
+                table=table, copy=_copy(f"{table}_partitioned", table)
+            )
+        )
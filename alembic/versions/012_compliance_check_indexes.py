@@ -0,0 +1,49 @@
+"""compliance_check_indexes
+
+Revision ID: 012_compliance_check_indexes
+Revises: 011_partition_audit_and_error_logs
+Create Date: 2026-10-18
+
+Adds indexes on compliance_checks for the per-run summary and the employee
+report: (check_run_id, compliance_status) for the run totals and violation
+breakdowns, a partial (check_run_id, job_code) index over violations for the
+top violating job codes, and (employee_upn, created_at DESC) for an
+employee's latest checks.
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "012_compliance_check_indexes"
+down_revision: Union[str, None] = "011_partition_audit_and_error_logs"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_compliance_checks_run_status",
+        "compliance_checks",
+        ["check_run_id", "compliance_status"],
+    )
+    op.create_index(
+        "ix_compliance_checks_run_violations",
+        "compliance_checks",
+        ["check_run_id", "job_code"],
+        postgresql_where=sa.text("compliance_status <> 'compliant'"),
+    )
+    op.create_index(
+        "ix_compliance_checks_employee_recent",
+        "compliance_checks",
+        ["employee_upn", sa.text("created_at DESC")],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_compliance_checks_employee_recent", table_name="compliance_checks"
+    )
+    op.drop_index("ix_compliance_checks_run_violations", table_name="compliance_checks")
+    op.drop_index("ix_compliance_checks_run_status", table_name="compliance_checks")
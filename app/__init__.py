@@ -61,6 +61,13 @@ def _configure_json_logging() -> None:
 def create_app():
     app = Flask(__name__)
 
+    # Encode JSON responses with orjson when it is installed; the provider
+    # keeps Flask's default output format.
+    from app.utils.json_provider import OrjsonProvider, orjson
+
+    if orjson is not None:
+        app.json = OrjsonProvider(app)
+
     # WD-NET-04 — honor X-Forwarded-Proto/Host so url_for(_external=True) emits HTTPS
     # behind Traefik. Hop count is 1 (Traefik only). DO NOT set higher — would trust
     # forged X-Forwarded-* headers from the client (Pitfall 4 in 09-RESEARCH.md).
@@ -243,6 +250,23 @@ def create_app():
                     cache_cleanup.start()
                     app.logger.info("Cache cleanup background service started")
 
+                # Batch audit_log inserts off the request path
+                # D-06: skip background thread under TESTING; tests assert on rows
+                # immediately after each log_* call, which needs synchronous saves.
+                if not (app.config.get("TESTING") or os.environ.get("TESTING")):
+                    audit_writer = app.container.get("audit_writer")
+                    audit_writer.app = app
+                    audit_writer.start()
+                    app.logger.info("Audit writer background service started")
+
+                # Keep next month's audit_log/error_log partitions created ahead
+                # D-06: skip background thread under TESTING.
+                if not (app.config.get("TESTING") or os.environ.get("TESTING")):
+                    audit_partitions = app.container.get("audit_partitions")
+                    audit_partitions.app = app
+                    audit_partitions.start()
+                    app.logger.info("Audit partition background service started")
+
                 # Initialize Genesys cache using the validated service
                 # D-06: skip Genesys cache warmup under TESTING (avoids real HTTP calls).
                 if genesys_service and not (
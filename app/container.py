@@ -86,8 +86,16 @@ class ServiceContainer:
         return services
 
     def reset(self) -> None:
-        """Reset the container, clearing all service instances."""
+        """Reset the container, closing and clearing all service instances."""
         with self._lock:
+            for name, service in self._services.items():
+                # API services hold pooled HTTP connections
+                close = getattr(service, "close", None)
+                if callable(close):
+                    try:
+                        close()
+                    except Exception as e:
+                        logger.warning(f"Error closing service {name}: {e}")
             self._services.clear()
             logger.debug("Container reset - all service instances cleared")
 
@@ -140,6 +148,16 @@ def register_services(container: ServiceContainer) -> None:
     container.register("audit_logger", lambda c: audit_service_instance)
     container.register("audit_query", lambda c: audit_service_instance)
 
+    # Background audit writer (batches audit_log inserts via COPY)
+    from app.services.audit_writer import audit_writer
+
+    container.register("audit_writer", lambda c: audit_writer)
+
+    # Monthly audit_log/error_log partition maintenance (see migration 011)
+    from app.services.audit_partition_service import AuditPartitionService
+
+    container.register("audit_partitions", lambda c: AuditPartitionService())
+
     # Cache service
     container.register("genesys_cache", lambda c: GenesysCacheDB())
     container.register("sku_catalog", lambda c: SkuCatalogCache())
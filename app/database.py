@@ -2,14 +2,39 @@ from flask_sqlalchemy import SQLAlchemy
 from sqlalchemy import create_engine, pool
 from sqlalchemy.orm import scoped_session, sessionmaker
 from contextlib import contextmanager
+import json
 import os
 import logging
 
+try:
+    import orjson  # type: ignore[import-not-found]
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
 db = SQLAlchemy()
 
 
+class RawJSON(str):
+    """JSON text that has already been serialized.
+
+    JSON/JSONB columns normally run every bound value through json.dumps at
+    flush time; wrapping pre-encoded text in RawJSON lets it go to the driver
+    as-is instead of being encoded a second time (or stored as a JSON string).
+    """
+
+
+def json_serializer(value) -> str:
+    """Engine JSON serializer: RawJSON passes through untouched, everything
+    else is encoded with orjson when installed (stdlib json otherwise)."""
+    if isinstance(value, RawJSON):
+        return value
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(value)
+
+
 def get_database_uri() -> str:
     """Return the database connection URI from the DATABASE_URL environment variable.
 
@@ -45,6 +70,13 @@ def init_db(app):
         "pool_recycle": 1800,
         "pool_pre_ping": True,
         "max_overflow": 5,
+        # psycopg2 fast-execution helpers: executemany() INSERTs are rewritten
+        # into multi-row VALUES pages, and other executemany() statements
+        # (UPDATE/DELETE) go through execute_batch instead of one round-trip
+        # per parameter set.
+        "executemany_mode": "values_plus_batch",
+        "insertmanyvalues_page_size": 1000,
+        "json_serializer": json_serializer,
     }
 
     db.init_app(app)
@@ -76,6 +108,9 @@ class DatabaseConnection:
                 pool_size=5,
                 pool_recycle=3600,
                 pool_pre_ping=True,
+                executemany_mode="values_plus_batch",
+                insertmanyvalues_page_size=1000,
+                json_serializer=json_serializer,
             )
             self.session_factory = sessionmaker(bind=self.engine)
             self._session = scoped_session(self.session_factory)
@@ -73,7 +73,7 @@ class IAuditQueryService(ABC):
 
     @abstractmethod
     def get_user_activity(
-        self, user_email: str, days: int = 30
+        self, user_email: str, days: int = 30, limit: int = 10_000
     ) -> List[Dict[str, Any]]:
-        """Get activity logs for a specific user."""
+        """Get activity logs for a specific user (newest first, at most ``limit``)."""
         pass
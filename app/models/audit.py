@@ -1,8 +1,19 @@
-from typing import Optional, List, Dict, Any
+from datetime import datetime, timezone
+from typing import Any, Callable, ClassVar, Dict, List, Optional
+from sqlalchemy import DDL, Index, event, insert, text
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from app.database import db
 import json
 from .base import AuditableModel
 
+# search_services is stored as JSON text; skip the default ", " padding
+_COMPACT_SEPARATORS = (",", ":")
+
+SEARCH_TSV_EXPRESSION = (
+    "to_tsvector('simple', coalesce(search_query, '') || ' ' || "
+    "coalesce(action, '') || ' ' || coalesce(target_resource, ''))"
+)
+
 
 class AuditLog(AuditableModel):
     """Audit log model for tracking all system activities"""
@@ -25,13 +36,76 @@ class AuditLog(AuditableModel):
     search_services = db.Column(db.Text)  # JSON array as text
     error_message = db.synonym("message")  # Map to base class field
 
+    # Full-text vector over the free-text columns the admin log viewer
+    # searches; maintained by Postgres, never written by the application.
+    search_tsv = db.deferred(
+        db.Column(
+            TSVECTOR,
+            db.Computed(SEARCH_TSV_EXPRESSION, persisted=True),
+        )
+    )
+
+    # Migrated databases range-partition audit_log by month on created_at
+    # (migration 011, primary key (id, created_at)); the ORM keeps id as the
+    # identity since it is still unique via the shared sequence.
+    __table_args__ = (
+        # Trigram GIN indexes so the admin log viewer's ilike('%x%') filters
+        # can use an index scan instead of a sequential scan (requires pg_trgm).
+        *(
+            Index(
+                f"ix_audit_log_{column}_trgm",
+                column,
+                postgresql_using="gin",
+                postgresql_ops={column: "gin_trgm_ops"},
+            )
+            for column in (
+                "user_email",
+                "search_query",
+                "action",
+                "target_resource",
+                "ip_address",
+            )
+        ),
+        Index("ix_audit_log_search_tsv", "search_tsv", postgresql_using="gin"),
+        # Partial indexes for the per-event-type "newest first" listings; the
+        # search one covers the dashboard columns for index-only scans.
+        Index(
+            "ix_audit_log_search_recent",
+            text("created_at DESC"),
+            postgresql_where=text("event_type = 'search'"),
+            postgresql_include=[
+                "user_email",
+                "search_query",
+                "search_results_count",
+                "success",
+            ],
+        ),
+        Index(
+            "ix_audit_log_config_recent",
+            text("created_at DESC"),
+            postgresql_where=text("event_type = 'config'"),
+        ),
+        Index(
+            "ix_audit_log_error_recent",
+            text("created_at DESC"),
+            postgresql_where=text("event_type = 'error'"),
+        ),
+        # Walked by the distinct-user skip scan in get_users_with_activity
+        Index(
+            "ix_audit_log_user_email_not_system",
+            "user_email",
+            postgresql_where=text("user_email <> 'system'"),
+        ),
+    )
+
     def __repr__(self):
         return f"<AuditLog {self.id}: {self.event_type} by {self.user_email}>"
 
     def to_dict(self, exclude: Optional[List[str]] = None) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization"""
-        # Use base class to_dict and add custom handling for search_services
-        data = super().to_dict(exclude)
+        # Use base class to_dict and add custom handling for search_services;
+        # search_tsv is an internal index column, not part of the payload
+        data = super().to_dict(list(exclude or []) + ["search_tsv"])
 
         # Parse search_services JSON if present
         if self.search_services:
@@ -42,61 +116,94 @@ class AuditLog(AuditableModel):
 
         return data
 
+    # Optional callable installed by the background AuditWriter. It receives
+    # the row dict and returns True when it accepted the row for a batched
+    # write; otherwise the row is inserted synchronously.
+    _row_sink: ClassVar[Optional[Callable[[Dict[str, Any]], bool]]] = None
+
+    @classmethod
+    def set_row_sink(cls, sink: Optional[Callable[[Dict[str, Any]], bool]]):
+        """Route new audit rows through ``sink`` (``None`` restores direct saves)."""
+        cls._row_sink = sink
+
+    @classmethod
+    def build_row(cls, event_type, user_email, action, kwargs, **columns):
+        """Assemble an audit_log row dict from the keyword arguments shared by
+        every log_* helper; ``columns`` carries the event-specific fields."""
+        now = datetime.now(timezone.utc)
+        return {
+            "event_type": event_type,
+            "user_email": user_email,
+            "action": action,
+            "user_role": kwargs.get("user_role"),
+            "ip_address": kwargs.get("ip_address"),
+            "success": kwargs.get("success", True),
+            "message": kwargs.get("error_message"),
+            "additional_data": kwargs.get("additional_data"),
+            "session_id": kwargs.get("session_id"),
+            "user_agent": kwargs.get("user_agent"),
+            "created_at": now,
+            "updated_at": now,
+            **columns,
+        }
+
+    @classmethod
+    def log_event(cls, event_type, user_email, action, kwargs, commit=True, **columns):
+        """Record an audit row built by :meth:`build_row`.
+
+        Pass ``commit=False`` to stage the row in the current transaction.
+        Returns the new row's id, or None when the row was queued for a
+        batched write.
+        """
+        row = cls.build_row(event_type, user_email, action, kwargs, **columns)
+
+        sink = cls._row_sink
+        if sink is not None and sink(row):
+            return None
+        return cls.insert_row(row, commit=commit)
+
+    @classmethod
+    def insert_row(cls, row, commit=True):
+        """Insert one row dict synchronously and return its id."""
+        # Bulk-style INSERT ... RETURNING id: no ORM object, identity map
+        # entry or unit-of-work flush for a row nothing reads back
+        try:
+            audit_id = db.session.execute(
+                insert(cls).returning(cls.id), [row]
+            ).scalar_one()
+            if commit:
+                db.session.commit()
+            return audit_id
+        except Exception:
+            db.session.rollback()
+            raise
+
     @classmethod
     def log_search(cls, user_email, search_query, results_count, services, **kwargs):
         """Log a search event"""
-        log = cls(
-            event_type="search",
-            user_email=user_email,
-            action="identity_search",
+        return cls.log_event(
+            "search",
+            user_email,
+            "identity_search",
+            kwargs,
             search_query=search_query,
             search_results_count=results_count,
-            search_services=json.dumps(services),
-            user_role=kwargs.get("user_role"),
-            ip_address=kwargs.get("ip_address"),
-            success=kwargs.get("success", True),
-            message=kwargs.get("error_message"),
-            additional_data=kwargs.get("additional_data"),
-            session_id=kwargs.get("session_id"),
-            user_agent=kwargs.get("user_agent"),
+            search_services=json.dumps(services, separators=_COMPACT_SEPARATORS),
         )
-        return log.save()
 
     @classmethod
     def log_access(cls, user_email, action, target_resource, **kwargs):
         """Log an access event"""
-        log = cls(
-            event_type="access",
-            user_email=user_email,
-            action=action,
-            target_resource=target_resource,
-            user_role=kwargs.get("user_role"),
-            ip_address=kwargs.get("ip_address"),
-            success=kwargs.get("success", True),
-            message=kwargs.get("error_message"),
-            additional_data=kwargs.get("additional_data"),
-            session_id=kwargs.get("session_id"),
-            user_agent=kwargs.get("user_agent"),
+        return cls.log_event(
+            "access", user_email, action, kwargs, target_resource=target_resource
         )
-        return log.save()
 
     @classmethod
     def log_admin_action(cls, user_email, action, target_resource, **kwargs):
         """Log an admin action"""
-        log = cls(
-            event_type="admin",
-            user_email=user_email,
-            action=action,
-            target_resource=target_resource,
-            user_role=kwargs.get("user_role"),
-            ip_address=kwargs.get("ip_address"),
-            success=kwargs.get("success", True),
-            message=kwargs.get("error_message"),
-            additional_data=kwargs.get("additional_data"),
-            session_id=kwargs.get("session_id"),
-            user_agent=kwargs.get("user_agent"),
+        return cls.log_event(
+            "admin", user_email, action, kwargs, target_resource=target_resource
         )
-        return log.save()
 
     @classmethod
     def log_config_change(cls, user_email, action, config_key, **kwargs):
@@ -109,18 +216,17 @@ class AuditLog(AuditableModel):
                 "new_value": kwargs.get("new_value"),
             }
         )
+        kwargs["additional_data"] = additional_data
 
-        log = cls(
-            event_type="config",
-            user_email=user_email,
-            action=action,
-            target_resource=config_key,
-            user_role=kwargs.get("user_role"),
-            ip_address=kwargs.get("ip_address"),
-            success=kwargs.get("success", True),
-            message=kwargs.get("error_message"),
-            additional_data=additional_data,
-            session_id=kwargs.get("session_id"),
-            user_agent=kwargs.get("user_agent"),
+        return cls.log_event(
+            "config", user_email, action, kwargs, target_resource=config_key
         )
-        return log.save()
+
+
+# db.create_all() (fresh installs, tests) needs pg_trgm before the trigram
+# indexes above; Alembic installs it in 006_audit_log_search_indexes.
+event.listen(
+    AuditLog.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
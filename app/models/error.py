@@ -1,3 +1,4 @@
+from datetime import datetime, timezone
 from typing import Optional, List, Dict, Any
 from app.database import db
 from .base import AuditableModel
@@ -37,23 +38,31 @@ class ErrorLog(AuditableModel):
         return data
 
     @classmethod
-    def log_error(cls, error_type, error_message, **kwargs):
-        """Log an error"""
+    def build_row(cls, error_type, error_message, **kwargs):
+        """Assemble an error_log row dict (column name -> value)."""
         # Ensure error_message is not None to satisfy NOT NULL constraint
         if error_message is None:
             error_message = f"Unknown error of type: {error_type}"
 
-        log = cls(
-            error_type=error_type,
-            message=error_message,  # Use base class field
-            stack_trace=kwargs.get("stack_trace"),
-            user_email=kwargs.get("user_email"),
-            request_path=kwargs.get("request_path"),
-            request_method=kwargs.get("request_method"),
-            additional_data=kwargs.get("request_data"),  # Use base class field
-            ip_address=kwargs.get("ip_address"),
-            user_agent=kwargs.get("user_agent"),
-            severity=kwargs.get("severity", "ERROR"),
-            success=False,  # Errors are always failures
-        )
-        return log.save()
+        now = datetime.now(timezone.utc)
+        return {
+            "error_type": error_type,
+            "message": error_message,  # Use base class field
+            "stack_trace": kwargs.get("stack_trace"),
+            "user_email": kwargs.get("user_email"),
+            "request_path": kwargs.get("request_path"),
+            "request_method": kwargs.get("request_method"),
+            "additional_data": kwargs.get("request_data"),  # Use base class field
+            "ip_address": kwargs.get("ip_address"),
+            "user_agent": kwargs.get("user_agent"),
+            "severity": kwargs.get("severity", "ERROR"),
+            "success": False,  # Errors are always failures
+            "created_at": now,
+            "updated_at": now,
+        }
+
+    @classmethod
+    def log_error(cls, error_type, error_message, commit=True, **kwargs):
+        """Log an error"""
+        log = cls(**cls.build_row(error_type, error_message, **kwargs))
+        return log.save(commit=commit)
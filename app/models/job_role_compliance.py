@@ -6,9 +6,10 @@ across multiple systems (Keystone, AD, Genesys, etc.).
 """
 
 from datetime import datetime, timezone, date
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, Iterable, List, Optional, Tuple, cast
 from sqlalchemy.dialects.postgresql import JSONB
-from sqlalchemy import UniqueConstraint
+from sqlalchemy import Index, UniqueConstraint, text
+from sqlalchemy.orm import QueryableAttribute, contains_eager, joinedload
 from app.database import db
 from app.models.base import BaseModel, TimestampMixin, JSONDataMixin
 
@@ -196,10 +197,13 @@ class JobRoleMapping(BaseModel, TimestampMixin, JSONDataMixin):
 
     @classmethod
     def get_active_mappings_for_job_code(cls, job_code: str) -> List["JobRoleMapping"]:
-        """Get active mappings for a job code."""
+        """Get active mappings for a job code, with their system roles loaded."""
         today = date.today()
+        # db.relationship() is typed as the property, not the class attribute
+        system_role = cast(QueryableAttribute, cls.system_role)
         return (
-            cls.query.join(JobCode)
+            cls.query.options(joinedload(system_role))
+            .join(JobCode)
             .filter(
                 JobCode.job_code == job_code,
                 cls.effective_date <= today,
@@ -209,6 +213,30 @@ class JobRoleMapping(BaseModel, TimestampMixin, JSONDataMixin):
             .all()
         )
 
+    @classmethod
+    def get_active_mappings_for_job_codes(
+        cls, job_codes: Iterable[str]
+    ) -> Dict[str, List["JobRoleMapping"]]:
+        """Get active mappings for many job codes in one query, keyed by code."""
+        today = date.today()
+        system_role = cast(QueryableAttribute, cls.system_role)
+        job_code_attr = cast(QueryableAttribute, cls.job_code)
+        mappings = (
+            cls.query.options(joinedload(system_role), contains_eager(job_code_attr))
+            .join(JobCode)
+            .filter(
+                JobCode.job_code.in_(list(job_codes)),
+                cls.effective_date <= today,
+                db.or_(cls.expiration_date.is_(None), cls.expiration_date >= today),
+            )
+            .order_by(cls.priority.desc())
+            .all()
+        )
+        by_job_code: Dict[str, List["JobRoleMapping"]] = {}
+        for mapping in mappings:
+            by_job_code.setdefault(mapping.job_code.job_code, []).append(mapping)
+        return by_job_code
+
     @classmethod
     def get_current_mappings(cls) -> List["JobRoleMapping"]:
         """Get all currently active mappings."""
@@ -379,6 +407,23 @@ class ComplianceCheck(BaseModel, TimestampMixin, JSONDataMixin):
     """Model for individual compliance check results."""
 
     __tablename__ = "compliance_checks"
+    __table_args__ = (
+        # Per-run totals and violation breakdowns in get_compliance_summary
+        Index("ix_compliance_checks_run_status", "check_run_id", "compliance_status"),
+        # Top violating job codes for a run
+        Index(
+            "ix_compliance_checks_run_violations",
+            "check_run_id",
+            "job_code",
+            postgresql_where=text("compliance_status <> 'compliant'"),
+        ),
+        # An employee's latest checks in get_employee_compliance_report
+        Index(
+            "ix_compliance_checks_employee_recent",
+            "employee_upn",
+            text("created_at DESC"),
+        ),
+    )
 
     check_run_id = db.Column(
         db.String(100),
@@ -442,13 +487,18 @@ class ComplianceCheck(BaseModel, TimestampMixin, JSONDataMixin):
             .all()
         )
 
-    def to_dict_with_employee_info(self) -> Dict[str, Any]:
-        """Convert to dict with additional employee context."""
+    def to_dict_with_employee_info(self, profile: Any = None) -> Dict[str, Any]:
+        """Convert to dict with additional employee context.
+
+        Pass the employee's profile when the caller already has it loaded;
+        otherwise it is looked up by UPN.
+        """
         result = self.to_dict()
         # Add employee info from employee_profiles if available
-        from app.models.employee_profiles import EmployeeProfiles
+        if profile is None:
+            from app.models.employee_profiles import EmployeeProfiles
 
-        profile = EmployeeProfiles.query.filter_by(upn=self.employee_upn).first()
+            profile = EmployeeProfiles.query.filter_by(upn=self.employee_upn).first()
         if profile:
             result["employee_job_code"] = profile.ukg_job_code
             result["employee_live_role"] = profile.live_role
@@ -496,6 +546,23 @@ class EmployeeRoleAssignment(BaseModel, TimestampMixin, JSONDataMixin):
             query = query.filter_by(system_name=system_name)
         return query.order_by(cls.system_name, cls.role_name).all()
 
+    @classmethod
+    def get_roles_for_employees(
+        cls, employee_upns: Iterable[str]
+    ) -> Dict[str, List["EmployeeRoleAssignment"]]:
+        """Get active role assignments for many employees, keyed by UPN."""
+        assignments = (
+            cls.query.filter(
+                cls.employee_upn.in_(list(employee_upns)), cls.is_active.is_(True)
+            )
+            .order_by(cls.employee_upn, cls.system_name, cls.role_name)
+            .all()
+        )
+        by_upn: Dict[str, List["EmployeeRoleAssignment"]] = {}
+        for assignment in assignments:
+            by_upn.setdefault(assignment.employee_upn, []).append(assignment)
+        return by_upn
+
     @classmethod
     def get_employees_with_role(
         cls, system_name: str, role_name: str
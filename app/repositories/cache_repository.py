@@ -11,9 +11,12 @@ class CacheRepository(ICacheRepository):
     """SQLAlchemy implementation of cache repository."""
 
     def get_token(self, service_name: str) -> Optional[Any]:
-        """Get cached token for a service."""
-        token = ApiToken.get_token(service_name)
-        return token.access_token if token else None
+        """Get the cached token row for a service.
+
+        Returns the ApiToken (with ``access_token`` and ``expires_at``) so
+        callers can keep the expiry alongside the token.
+        """
+        return ApiToken.get_token(service_name)
 
     def cache_api_token(
         self, service_name: str, access_token: str, expires_in_seconds: int
@@ -0,0 +1,201 @@
+"""Background service that creates upcoming monthly audit/error log partitions.
+
+Migration 011 range-partitions ``audit_log`` and ``error_log`` by month on
+``created_at``. Rows for a month without its own partition land in the
+``<table>_default`` catch-all, which defeats partition pruning, so this service
+keeps the current and next month's partitions in place ahead of time. If the
+service was down across a month boundary, that month's rows are moved out of
+the default partition into the new one as it is created. Every worker runs the
+service, so each pass holds a transaction-level advisory lock. Mirrors
+the lifecycle pattern of ``app/services/cache_cleanup_service.py`` (idempotent
+``start()``, daemon thread, app-context wrapped per-iteration body).
+
+Databases built with ``db.create_all()`` (tests, throwaway dev databases) have
+plain, unpartitioned tables; the service detects that and does nothing.
+"""
+
+import logging
+import threading
+import time
+from datetime import date, datetime, timezone
+from typing import List, Optional, Tuple
+
+from flask import Flask
+from sqlalchemy import text
+
+logger = logging.getLogger(__name__)
+
+PARTITIONED_TABLES = ("audit_log", "error_log")
+
+# How many months beyond the current one to keep partitions for
+MONTHS_AHEAD = 1
+
+_IS_PARTITIONED_SQL = text("""
+    SELECT EXISTS (
+        SELECT 1
+        FROM pg_partitioned_table p
+        JOIN pg_class c ON c.oid = p.partrelid
+        WHERE c.relname = :table AND c.relnamespace = current_schema()::regnamespace
+    )
+""")
+
+
+# Serializes partition maintenance across workers; released at commit
+_PARTITION_LOCK_SQL = text(
+    "SELECT pg_advisory_xact_lock(hashtext('whodis_log_partitions'))"
+)
+
+# Columns that can be copied between partitions (generated ones are recomputed)
+_COPY_COLUMNS_SQL = text("""
+    SELECT string_agg(quote_ident(column_name), ', ' ORDER BY ordinal_position)
+    FROM information_schema.columns
+    WHERE table_schema = current_schema()
+      AND table_name = :table
+      AND is_generated = 'NEVER'
+""")
+
+
+def _add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_bounds(table: str, month: date) -> Tuple[str, date, date]:
+    """Return (partition name, lower bound, upper bound) for ``month``.
+
+    Names follow the ``<table>_pYYYY_MM`` scheme used by migration 011.
+    """
+    start = month.replace(day=1)
+    return f"{table}_p{start:%Y_%m}", start, _add_months(start, 1)
+
+
+class AuditPartitionService:
+    """Daily background job that pre-creates monthly log partitions."""
+
+    def __init__(self, app: Optional[Flask] = None) -> None:
+        self.app = app
+        self.is_running = False
+        self.thread: Optional[threading.Thread] = None
+        # Daily is plenty for partitions created a month ahead.
+        self.check_interval = 86400
+
+    def init_app(self, app: Flask) -> None:
+        """Bind a Flask app for the background thread's app_context wrapping."""
+        self.app = app
+
+    def start(self) -> None:
+        """Start the background partition thread (idempotent)."""
+        if self.is_running:
+            logger.warning("Audit partition service is already running")
+            return
+
+        self.is_running = True
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+        logger.info("Audit partition service started")
+
+    def stop(self) -> None:
+        """Signal the background thread to exit on its next loop iteration."""
+        self.is_running = False
+        if self.thread:
+            self.thread.join(timeout=5)
+        logger.info("Audit partition service stopped")
+
+    def _run(self) -> None:
+        """Main loop: ensure partitions → sleep, swallowing exceptions."""
+        while self.is_running:
+            try:
+                if not self.app:
+                    logger.warning(
+                        "Audit partition service has no Flask app configured"
+                    )
+                else:
+                    with self.app.app_context():
+                        created = self.ensure_partitions()
+                        if created:
+                            logger.info(
+                                "Created log partitions: %s", ", ".join(created)
+                            )
+            except Exception as e:
+                # Never let the thread die; the default partition still
+                # accepts rows until the next successful run.
+                logger.error(
+                    f"Error in audit partition service: {str(e)}", exc_info=True
+                )
+
+            time.sleep(self.check_interval)
+
+    def ensure_partitions(self, today: Optional[date] = None) -> List[str]:
+        """Create any missing partitions for this month through MONTHS_AHEAD.
+
+        Returns the names of the partitions created.
+        """
+        from app.database import db
+
+        today = today or datetime.now(timezone.utc).date()
+        created = []
+        try:
+            db.session.execute(_PARTITION_LOCK_SQL)
+            for table in PARTITIONED_TABLES:
+                if not db.session.execute(
+                    _IS_PARTITIONED_SQL, {"table": table}
+                ).scalar():
+                    continue
+                for offset in range(MONTHS_AHEAD + 1):
+                    name, start, end = partition_bounds(
+                        table, _add_months(today.replace(day=1), offset)
+                    )
+                    exists = db.session.execute(
+                        text("SELECT to_regclass(:name) IS NOT NULL"), {"name": name}
+                    ).scalar()
+                    if exists:
+                        continue
+                    self._create_partition(table, name, start, end)
+                    created.append(name)
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+        return created
+
+    @staticmethod
+    def _create_partition(table: str, name: str, start: date, end: date) -> None:
+        """Create partition ``name``, first rescuing its rows from the default."""
+        from app.database import db
+
+        bounds = f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+        in_range = "created_at >= :start AND created_at < :end"
+        params = {"start": start, "end": end}
+        stranded = db.session.execute(
+            text(f'SELECT EXISTS (SELECT 1 FROM "{table}_default" WHERE {in_range})'),
+            params,
+        ).scalar()
+        if not stranded:
+            db.session.execute(
+                text(
+                    f'CREATE TABLE IF NOT EXISTS "{name}" PARTITION OF "{table}" {bounds}'
+                )
+            )
+            return
+
+        # PostgreSQL refuses a partition whose range already has rows in the
+        # default partition, so build it standalone, move the rows, then attach
+        logger.warning(f"Moving {name} rows out of {table}_default")
+        cols = db.session.execute(_COPY_COLUMNS_SQL, {"table": table}).scalar()
+        db.session.execute(
+            text(
+                f'CREATE TABLE "{name}" (LIKE "{table}" INCLUDING DEFAULTS '
+                "INCLUDING GENERATED INCLUDING CONSTRAINTS)"
+            )
+        )
+        db.session.execute(
+            text(
+                f'WITH moved AS (DELETE FROM "{table}_default" WHERE {in_range} '
+                f"RETURNING {cols}) "
+                f'INSERT INTO "{name}" ({cols}) SELECT {cols} FROM moved'
+            ),
+            params,
+        )
+        db.session.execute(
+            text(f'ALTER TABLE "{table}" ATTACH PARTITION "{name}" {bounds}')
+        )
@@ -1,19 +1,344 @@
+import json
 import logging
-from typing import Optional, Dict, Any, List
-from datetime import datetime, timedelta
-from sqlalchemy import and_, or_, desc, func
+import threading
+import time
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+from datetime import datetime, timedelta, timezone
+from flask import g, has_request_context
+from sqlalchemy import and_, bindparam, or_, desc, func, insert, select, text
 from app.models.audit import AuditLog
 from app.models.error import ErrorLog
-from app.database import db
+from app.database import RawJSON, db, json_serializer
 from app.interfaces.audit_service import IAuditLogger, IAuditQueryService
 
 logger = logging.getLogger(__name__)
 
+# Dashboard statistics: the time-bounded subset is scanned once into a CTE
+# and the figures are aggregated over it in a single pass (conditional
+# counts via FILTER); only the top-10 list needs its own grouping.
+_SEARCH_STATISTICS_SQL = text("""
+    WITH s AS (
+        SELECT user_email, search_query, search_results_count, success
+        FROM audit_log
+        WHERE event_type = 'search' AND created_at >= :cutoff
+    )
+    SELECT
+        count(*) AS total_searches,
+        count(DISTINCT user_email) AS unique_users,
+        count(DISTINCT search_query) AS unique_queries,
+        avg(search_results_count) AS avg_results,
+        count(*) FILTER (WHERE success IS false) AS failed_searches,
+        (
+            SELECT json_agg(
+                json_build_object('search_query', t.search_query, 'count', t.count)
+                ORDER BY t.count DESC
+            )
+            FROM (
+                SELECT search_query, count(search_query) AS count
+                FROM s
+                GROUP BY search_query
+                ORDER BY count DESC
+                LIMIT 10
+            ) t
+        ) AS top_searches
+    FROM s
+""")
+
+_ERROR_STATISTICS_SQL = text("""
+    WITH e AS (
+        SELECT error_type, user_email, request_path
+        FROM error_log
+        WHERE created_at >= :cutoff
+    )
+    SELECT
+        count(*) AS total_errors,
+        count(DISTINCT error_type) AS unique_error_types,
+        count(DISTINCT user_email) AS affected_users,
+        count(DISTINCT request_path) AS affected_paths,
+        (
+            SELECT json_agg(
+                json_build_object('error_type', t.error_type, 'count', t.count)
+                ORDER BY t.count DESC
+            )
+            FROM (
+                SELECT error_type, count(error_type) AS count
+                FROM e
+                GROUP BY error_type
+                ORDER BY count DESC
+                LIMIT 10
+            ) t
+        ) AS top_errors
+    FROM e
+""")
+
+
+# Distinct non-system users via a recursive skip scan: each step is a single
+# seek on ix_audit_log_user_email_not_system for the next larger email, so the
+# cost grows with the number of users rather than the number of audit rows.
+# Emits emails in ascending order.
+_ACTIVE_USERS_SQL = text("""
+    WITH RECURSIVE t AS (
+        SELECT min(user_email) AS e
+        FROM audit_log
+        WHERE user_email <> 'system'
+        UNION ALL
+        SELECT (
+            SELECT min(user_email)
+            FROM audit_log
+            WHERE user_email > t.e AND user_email <> 'system'
+        )
+        FROM t
+        WHERE t.e IS NOT NULL
+    )
+    SELECT e FROM t WHERE e IS NOT NULL
+""")
+
+# Upper bound for the day-window report methods, which previously returned
+# every matching row; callers that need more must page explicitly.
+MAX_REPORT_ROWS = 10_000
+
+# Rows fetched per server-side cursor round-trip when streaming reports
+_STREAM_BATCH_SIZE = 500
+
+
+# Column projections for the read paths: queries return plain row tuples
+# instead of hydrated ORM objects (search_tsv is an internal index column).
+_AUDIT_COLUMNS = tuple(
+    column for column in AuditLog.__table__.columns if column.name != "search_tsv"
+)
+_AUDIT_KEYS = tuple(column.name for column in _AUDIT_COLUMNS)
+_ERROR_COLUMNS = tuple(ErrorLog.__table__.columns)
+_ERROR_KEYS = tuple(column.name for column in _ERROR_COLUMNS)
+
+
+# Unfiltered "newest first" listings, built once at import: the common admin
+# dashboard calls skip building a select per request.
+_RECENT_LOGS_STMT = (
+    select(*_AUDIT_COLUMNS).order_by(desc(AuditLog.timestamp)).limit(bindparam("limit"))
+)
+_RECENT_SEARCHES_STMT = (
+    select(*_AUDIT_COLUMNS)
+    .where(AuditLog.event_type == "search")
+    .order_by(desc(AuditLog.timestamp))
+    .limit(bindparam("limit"))
+)
+
+
+def _row_dict(row, keys) -> Dict[str, Any]:
+    """Serialize a result row the same way SerializableMixin.to_dict does.
+
+    Rows come from selects whose leading columns are exactly ``keys``, so the
+    values are paired positionally (trailing extras such as query_logs'
+    window ``total`` are ignored) instead of looked up by name.
+    """
+    data = {
+        key: value.isoformat() if isinstance(value, datetime) else value
+        for key, value in zip(keys, row)
+    }
+    data["timestamp"] = data.get("created_at")
+    return data
+
+
+def _audit_dict(row) -> Dict[str, Any]:
+    """AuditLog.to_dict() equivalent for a row selected from _AUDIT_COLUMNS."""
+    data = _row_dict(row, _AUDIT_KEYS)
+    if data["search_services"]:
+        data["search_services"] = json.loads(data["search_services"])
+    return data
+
+
+def _error_dict(row) -> Dict[str, Any]:
+    """ErrorLog.to_dict() equivalent for a row selected from _ERROR_COLUMNS."""
+    return _row_dict(row, _ERROR_KEYS)
+
+
+def _stream_dicts(stmt, to_dict) -> List[Dict[str, Any]]:
+    """Execute a select through a server-side cursor and convert each row as
+    its batch arrives, so at most one batch is buffered at a time."""
+    result = db.session.execute(stmt.execution_options(yield_per=_STREAM_BATCH_SIZE))
+    return [to_dict(row) for row in result]
+
+
+def _text_filter_shape(value: str) -> Tuple[str, str]:
+    """Return the ``_text_filter`` variant for ``value`` and its bound value.
+
+    A value ending in a single trailing ``%`` (e.g. ``10.%``) is a ``"prefix"``
+    match; anything else is a ``"contains"`` match.
+    """
+    if value.endswith("%") and "%" not in value[:-1]:
+        return "prefix", value.lower()
+    return "contains", f"%{value}%"
+
+
+def _text_filter(column, shape: str, value):
+    """Case-insensitive substring filter for admin text search.
+
+    ``"prefix"`` is an anchored match against ``lower(column)``, which the
+    ``text_pattern_ops`` expression indexes serve; ``"contains"`` stays a
+    ``%value%`` ILIKE backed by the trigram indexes. ``value`` is the literal
+    or bind parameter from ``_text_filter_shape``.
+    """
+    if shape == "prefix":
+        return func.lower(column).like(value)
+    return column.ilike(value)
+
+
+def _free_text_shape(search_query: str) -> Tuple[str, str]:
+    """Return the ``_free_text_filter`` variant for a query and its bound value."""
+    if len(search_query.split()) > 1:
+        return "fulltext", search_query
+    return "contains", f"%{search_query}%"
+
+
+def _free_text_filter(shape: str, value):
+    """Filter matching a query against search_query/action/target_resource.
+
+    Multi-word queries (``"fulltext"``) use the ``search_tsv`` full-text index
+    (every word must appear, in any order or column); a single term keeps the
+    substring ILIKE match served by the trigram indexes, so partial names
+    still match.
+    """
+    if shape == "fulltext":
+        return AuditLog.search_tsv.op("@@")(func.plainto_tsquery("simple", value))
+    return or_(
+        AuditLog.search_query.ilike(value),
+        AuditLog.action.ilike(value),
+        AuditLog.target_resource.ilike(value),
+    )
+
+
+# query_logs filter shape: one entry per optional filter, None when absent,
+# otherwise the variant of the clause it renders (see _text_filter_shape and
+# _free_text_shape for what the variants mean).
+_QueryShape = Tuple[bool, Optional[str], bool, bool, Optional[str], Optional[str], bool]
+
+
+def _query_logs_shape_and_params(
+    event_type, user_email, start_date, end_date, search_query, ip_address, success
+) -> Tuple[_QueryShape, Dict[str, Any]]:
+    """Reduce query_logs arguments to a cache key plus bound parameter values."""
+    params: Dict[str, Any] = {}
+    if event_type:
+        params["event_type"] = event_type
+    user_shape = None
+    if user_email:
+        user_shape, params["user_email"] = _text_filter_shape(user_email)
+    if start_date:
+        params["start_date"] = datetime.fromisoformat(start_date)
+    if end_date:
+        params["end_date"] = datetime.fromisoformat(end_date)
+    search_shape = None
+    if search_query:
+        search_shape, params["search_query"] = _free_text_shape(search_query)
+    ip_shape = None
+    if ip_address:
+        ip_shape, params["ip_address"] = _text_filter_shape(ip_address)
+    if success is not None:
+        params["success"] = success
+    shape = (
+        bool(event_type),
+        user_shape,
+        bool(start_date),
+        bool(end_date),
+        search_shape,
+        ip_shape,
+        success is not None,
+    )
+    return shape, params
+
+
+@lru_cache(maxsize=None)
+def _query_logs_statements(shape: _QueryShape):
+    """Build (page, count) statements for one filter shape, once.
+
+    Values are left as bind parameters, so repeat dashboard polls reuse the
+    same statement objects and SQLAlchemy's compiled-SQL cache entry instead
+    of rebuilding the filter expression tree per request.
+    """
+    has_event, user_shape, has_start, has_end, search_shape, ip_shape, has_ok = shape
+    filters = []
+    if has_event:
+        filters.append(AuditLog.event_type == bindparam("event_type"))
+    if user_shape:
+        filters.append(
+            _text_filter(AuditLog.user_email, user_shape, bindparam("user_email"))
+        )
+    if has_start:
+        filters.append(AuditLog.timestamp >= bindparam("start_date"))
+    if has_end:
+        filters.append(AuditLog.timestamp <= bindparam("end_date"))
+    if search_shape:
+        filters.append(_free_text_filter(search_shape, bindparam("search_query")))
+    if ip_shape:
+        filters.append(
+            _text_filter(AuditLog.ip_address, ip_shape, bindparam("ip_address"))
+        )
+    if has_ok:
+        filters.append(AuditLog.success == bindparam("success"))
+
+    # Rows plus the unpaginated match count from one statement, so the
+    # filters are evaluated once instead of by a separate COUNT query
+    page = select(*_AUDIT_COLUMNS, func.count().over().label("total"))
+    count = select(func.count()).select_from(AuditLog)
+    if filters:
+        page = page.where(and_(*filters))
+        count = count.where(and_(*filters))
+    page = (
+        page.order_by(desc(AuditLog.timestamp))
+        .limit(bindparam("limit"))
+        .offset(bindparam("offset"))
+    )
+    return page, count
+
+
+def _now_cached() -> datetime:
+    """Current UTC time, memoized on ``flask.g`` for the rest of the request.
+
+    The admin dashboard computes several day-window cutoffs back to back;
+    they now share one clock read (and one consistent "now"). Outside a
+    request the time is read fresh on every call.
+    """
+    if not has_request_context():
+        return datetime.now(timezone.utc)
+    now: Optional[datetime] = g.get("audit_now")
+    if now is None:
+        now = g.audit_now = datetime.now(timezone.utc)
+    return now
+
+
+@contextmanager
+def _safe_write(op_name: str):
+    """Swallow and log a failed audit write, leaving the session usable.
+
+    Audit logging must never break the request that triggered it, so any
+    exception is logged and the session rolled back; if even the rollback
+    fails (e.g. the connection is gone) the session is closed instead.
+    """
+    try:
+        yield
+    except Exception as e:
+        logger.error(f"Failed to log {op_name}: {e}")
+        try:
+            db.session.rollback()
+        except Exception:
+            db.session.close()
+
 
 class PostgresAuditService(IAuditLogger, IAuditQueryService):
     """PostgreSQL-based audit service using SQLAlchemy models"""
 
+    # How long the admin filter dropdown lookups stay cached
+    LOOKUP_TTL_SECONDS = 60
+    # Bound on the remembered-user set used for cache invalidation
+    _MAX_KNOWN_USERS = 10_000
+
     def __init__(self):
+        # name -> (value, expires_at monotonic seconds)
+        self._lookup_cache: Dict[str, Tuple[List[str], float]] = {}
+        self._lookup_lock = threading.Lock()
+        self._known_users: Set[str] = set()
         logger.info("PostgreSQL audit service initialized")
 
     def init_app(self, app):
@@ -30,33 +355,23 @@ class PostgresAuditService(IAuditLogger, IAuditQueryService):
         services: List[str],
         **kwargs,
     ):
-        try:
+        self._note_user(user_email)
+        with _safe_write("search"):
             AuditLog.log_search(
                 user_email, search_query, results_count, services, **kwargs
             )
-        except Exception as e:
-            logger.error(f"Failed to log search: {e}")
-            try:
-                db.session.rollback()
-            except Exception:
-                pass
 
     def log_access(self, user_email: str, action: str, target_resource: str, **kwargs):
-        try:
+        self._note_user(user_email)
+        with _safe_write("access"):
             AuditLog.log_access(user_email, action, target_resource, **kwargs)
-        except Exception as e:
-            logger.error(f"Failed to log access: {e}")
-            # Ensure session is rolled back on error
-            try:
-                db.session.rollback()
-            except Exception:
-                pass
 
     def log_access_denial(
         self, user_email: str, requested_resource: str, reason: str, **kwargs
     ) -> None:
         """Log an access denial event."""
-        try:
+        self._note_user(user_email)
+        with _safe_write("access denial"):
             AuditLog.log_access(
                 user_email=user_email,
                 action="access_denied",
@@ -65,8 +380,6 @@ class PostgresAuditService(IAuditLogger, IAuditQueryService):
                 message=reason,
                 **kwargs,
             )
-        except Exception as e:
-            logger.error(f"Failed to log access denial: {e}")
 
     def log_admin_action(
         self,
@@ -77,7 +390,8 @@ class PostgresAuditService(IAuditLogger, IAuditQueryService):
         **kwargs,
     ) -> None:
         """Log an administrative action."""
-        try:
+        self._note_user(user_email)
+        with _safe_write("admin action"):
             AuditLog.log_admin_action(
                 user_email=user_email,
                 action=action,
@@ -85,22 +399,11 @@ class PostgresAuditService(IAuditLogger, IAuditQueryService):
                 additional_data=details,
                 **kwargs,
             )
-        except Exception as e:
-            logger.error(f"Failed to log admin action: {e}")
-            try:
-                db.session.rollback()
-            except Exception:
-                pass
 
     def log_config_change(self, user_email: str, config_key: str, **kwargs):
-        try:
+        self._note_user(user_email)
+        with _safe_write("config change"):
             AuditLog.log_config_change(user_email, config_key, **kwargs)
-        except Exception as e:
-            logger.error(f"Failed to log config change: {e}")
-            try:
-                db.session.rollback()
-            except Exception:
-                pass
 
     def log_config(
         self,
@@ -111,15 +414,14 @@ class PostgresAuditService(IAuditLogger, IAuditQueryService):
         **kwargs,
     ):
         """Log configuration changes (backward compatibility alias)."""
-        try:
+        self._note_user(user_email)
+        with _safe_write("config"):
             # Add old_value and new_value to kwargs for the actual method
             kwargs["old_value"] = old_value
             kwargs["new_value"] = new_value
             AuditLog.log_config_change(
                 user_email, "config_change", config_key, **kwargs
             )
-        except Exception as e:
-            logger.error(f"Failed to log config: {e}")
 
     def log_error(
         self,
@@ -128,32 +430,34 @@ class PostgresAuditService(IAuditLogger, IAuditQueryService):
         stack_trace: Optional[str] = None,
         **kwargs,
     ) -> None:
-        try:
-            # Log to audit log
-            audit_log = AuditLog(
-                event_type="error",
-                user_email=kwargs.get("user_email", "system"),
-                action=error_type,
-                target_resource=kwargs.get("request_path"),
-                user_role=kwargs.get("user_role"),
-                ip_address=kwargs.get("ip_address"),
+        user_email = kwargs.get("user_email", "system")
+        self._note_user(user_email)
+        with _safe_write("error"):
+            # The caller's kwargs already carry user_role/ip_address/session_id/
+            # user_agent, so they are handed over as-is; additional_data is
+            # encoded once here rather than again by the JSONB bind at flush.
+            audit_row = AuditLog.build_row(
+                "error",
+                user_email,
+                error_type,
+                kwargs,
                 success=False,
                 message=error_message,
-                additional_data={
-                    "error_type": error_type,
-                    "stack_trace": stack_trace,
-                    "request_method": kwargs.get("request_method"),
-                },
-                session_id=kwargs.get("session_id"),
-                user_agent=kwargs.get("user_agent"),
+                additional_data=RawJSON(
+                    json_serializer(
+                        {
+                            "error_type": error_type,
+                            "stack_trace": stack_trace,
+                            "request_method": kwargs.get("request_method"),
+                        }
+                    )
+                ),
+                target_resource=kwargs.get("request_path"),
             )
-            audit_log.save()
-
-            # Also log to dedicated error log
-            ErrorLog.log_error(
-                error_type=error_type,
-                error_message=error_message,
-                user_email=kwargs.get("user_email", "system"),
+            error_row = ErrorLog.build_row(
+                error_type,
+                error_message,
+                user_email=user_email,
                 stack_trace=stack_trace,
                 request_path=kwargs.get("request_path"),
                 request_method=kwargs.get("request_method"),
@@ -161,8 +465,14 @@ class PostgresAuditService(IAuditLogger, IAuditQueryService):
                 ip_address=kwargs.get("ip_address"),
                 user_agent=kwargs.get("user_agent"),
             )
-        except Exception as e:
-            logger.error(f"Failed to log error: {e}")
+
+            # Both rows in one statement (a data-modifying CTE), so the pair
+            # costs a single round-trip and lands atomically
+            audit_insert = insert(AuditLog.__table__).values(audit_row).cte("audit")
+            db.session.execute(
+                insert(ErrorLog.__table__).values(error_row).add_cte(audit_insert)
+            )
+            db.session.commit()
 
     # Query methods
 
@@ -176,24 +486,31 @@ class PostgresAuditService(IAuditLogger, IAuditQueryService):
     ) -> List[Dict[str, Any]]:
         """Get recent audit logs with optional filters."""
         try:
-            query = AuditLog.query
+            if not (event_type or user_email or start_date or end_date):
+                rows = db.session.execute(_RECENT_LOGS_STMT, {"limit": limit})
+                return [_audit_dict(row) for row in rows]
+
+            query = select(*_AUDIT_COLUMNS)
 
             # Apply filters
             filters = []
             if event_type:
                 filters.append(AuditLog.event_type == event_type)
             if user_email:
-                filters.append(AuditLog.user_email.ilike(f"%{user_email}%"))
+                filters.append(
+                    _text_filter(AuditLog.user_email, *_text_filter_shape(user_email))
+                )
             if start_date:
                 filters.append(AuditLog.timestamp >= start_date)
             if end_date:
                 filters.append(AuditLog.timestamp <= end_date)
 
-            if filters:
-                query = query.filter(and_(*filters))
-
-            results = query.order_by(desc(AuditLog.timestamp)).limit(limit).all()
-            return [log.to_dict() for log in results]
+            rows = db.session.execute(
+                query.where(and_(*filters))
+                .order_by(desc(AuditLog.timestamp))
+                .limit(limit)
+            )
+            return [_audit_dict(row) for row in rows]
         except Exception as e:
             logger.error(f"Failed to get recent logs: {e}")
             return []
@@ -211,47 +528,31 @@ class PostgresAuditService(IAuditLogger, IAuditQueryService):
         offset: int = 0,
     ) -> Dict[str, Any]:
         try:
-            query = AuditLog.query
-
-            # Apply filters
-            filters = []
-            if event_type:
-                filters.append(AuditLog.event_type == event_type)
-            if user_email:
-                filters.append(AuditLog.user_email.ilike(f"%{user_email}%"))
-            if start_date:
-                filters.append(AuditLog.timestamp >= datetime.fromisoformat(start_date))
-            if end_date:
-                filters.append(AuditLog.timestamp <= datetime.fromisoformat(end_date))
-            if search_query:
-                filters.append(
-                    or_(
-                        AuditLog.search_query.ilike(f"%{search_query}%"),
-                        AuditLog.action.ilike(f"%{search_query}%"),
-                        AuditLog.target_resource.ilike(f"%{search_query}%"),
-                    )
-                )
-            if ip_address:
-                filters.append(AuditLog.ip_address.ilike(f"%{ip_address}%"))
-            if success is not None:
-                filters.append(AuditLog.success == success)
+            shape, params = _query_logs_shape_and_params(
+                event_type,
+                user_email,
+                start_date,
+                end_date,
+                search_query,
+                ip_address,
+                success,
+            )
+            page, count = _query_logs_statements(shape)
 
-            if filters:
-                query = query.filter(and_(*filters))
+            rows = db.session.execute(
+                page, {**params, "limit": limit, "offset": offset}
+            ).all()
 
-            # Get total count
-            total = query.count()
-
-            # Get paginated results
-            results = (
-                query.order_by(desc(AuditLog.timestamp))
-                .limit(limit)
-                .offset(offset)
-                .all()
-            )
+            if rows:
+                total = rows[0].total
+            elif offset:
+                # Page past the end: no row carries the window count
+                total = db.session.execute(count, params).scalar() or 0
+            else:
+                total = 0
 
             return {
-                "results": [log.to_dict() for log in results],
+                "results": [_audit_dict(row) for row in rows],
                 "total": total,
                 "limit": limit,
                 "offset": offset,
@@ -267,116 +568,102 @@ class PostgresAuditService(IAuditLogger, IAuditQueryService):
 
     def get_recent_searches(self, limit: int = 100) -> List[Dict[str, Any]]:
         try:
-            results = (
-                AuditLog.query.filter_by(event_type="search")
-                .order_by(desc(AuditLog.timestamp))
-                .limit(limit)
-                .all()
-            )
-            return [log.to_dict() for log in results]
+            rows = db.session.execute(_RECENT_SEARCHES_STMT, {"limit": limit})
+            return [_audit_dict(row) for row in rows]
         except Exception as e:
             logger.error(f"Failed to get recent searches: {e}")
             return []
 
     def get_event_types(self) -> List[str]:
         try:
-            results = (
-                db.session.query(AuditLog.event_type)
-                .distinct()
-                .order_by(AuditLog.event_type)
-                .all()
-            )
-            return [r[0] for r in results]
+            return self._cached_lookup("event_types", self._query_event_types)
         except Exception as e:
             logger.error(f"Failed to get event types: {e}")
             return []
 
     def get_users_with_activity(self) -> List[str]:
         try:
-            results = (
-                db.session.query(AuditLog.user_email)
-                .filter(AuditLog.user_email != "system")
-                .distinct()
-                .order_by(AuditLog.user_email)
-                .all()
-            )
-            return [r[0] for r in results]
+            return self._cached_lookup("users", self._query_users_with_activity)
         except Exception as e:
             logger.error(f"Failed to get users: {e}")
             return []
 
+    def _query_event_types(self) -> List[str]:
+        results = (
+            db.session.query(AuditLog.event_type)
+            .distinct()
+            .order_by(AuditLog.event_type)
+            .all()
+        )
+        return [r[0] for r in results]
+
+    def _query_users_with_activity(self) -> List[str]:
+        users = list(db.session.execute(_ACTIVE_USERS_SQL).scalars())
+        with self._lookup_lock:
+            if len(users) <= self._MAX_KNOWN_USERS:
+                self._known_users.update(users)
+        return users
+
+    def _cached_lookup(self, name: str, loader: Callable[[], List[str]]) -> List[str]:
+        """Return ``loader()`` memoized for LOOKUP_TTL_SECONDS.
+
+        Failures propagate without being cached, so a transient DB error does
+        not pin an empty dropdown for the whole TTL.
+        """
+        now = time.monotonic()
+        with self._lookup_lock:
+            cached = self._lookup_cache.get(name)
+        if cached is not None and cached[1] > now:
+            return cached[0]
+
+        value = loader()
+        with self._lookup_lock:
+            self._lookup_cache[name] = (value, now + self.LOOKUP_TTL_SECONDS)
+        return value
+
+    def _note_user(self, user_email: Optional[str]) -> None:
+        """Drop the cached user list the first time a new user is logged."""
+        if not user_email or user_email == "system":
+            return
+        with self._lookup_lock:
+            if user_email in self._known_users:
+                return
+            if len(self._known_users) >= self._MAX_KNOWN_USERS:
+                self._known_users.clear()
+            self._known_users.add(user_email)
+            self._lookup_cache.pop("users", None)
+
     def get_user_activity(
-        self, user_email: str, days: int = 30
+        self, user_email: str, days: int = 30, limit: int = MAX_REPORT_ROWS
     ) -> List[Dict[str, Any]]:
         try:
-            cutoff = datetime.utcnow() - timedelta(days=days)
+            cutoff = _now_cached() - timedelta(days=days)
 
-            results = (
-                AuditLog.query.filter(AuditLog.user_email == user_email)
-                .filter(AuditLog.timestamp >= cutoff)
+            return _stream_dicts(
+                select(*_AUDIT_COLUMNS)
+                .where(AuditLog.user_email == user_email)
+                .where(AuditLog.timestamp >= cutoff)
                 .order_by(desc(AuditLog.timestamp))
-                .all()
+                .limit(limit),
+                _audit_dict,
             )
-            return [log.to_dict() for log in results]
         except Exception as e:
             logger.error(f"Failed to get user activity: {e}")
             return []
 
     def get_search_statistics(self, days: int = 30) -> Dict[str, Any]:
         try:
-            cutoff = datetime.utcnow() - timedelta(days=days)
-
-            # Base query for searches
-            search_query = AuditLog.query.filter(
-                AuditLog.event_type == "search"
-            ).filter(AuditLog.timestamp >= cutoff)
-
-            # Get basic stats
-            total_searches = search_query.count()
-            unique_users = (
-                db.session.query(func.count(func.distinct(AuditLog.user_email)))
-                .filter(AuditLog.event_type == "search")
-                .filter(AuditLog.timestamp >= cutoff)
-                .scalar()
-            )
-            unique_queries = (
-                db.session.query(func.count(func.distinct(AuditLog.search_query)))
-                .filter(AuditLog.event_type == "search")
-                .filter(AuditLog.timestamp >= cutoff)
-                .scalar()
-            )
-            avg_results = (
-                db.session.query(func.avg(AuditLog.search_results_count))
-                .filter(AuditLog.event_type == "search")
-                .filter(AuditLog.timestamp >= cutoff)
-                .scalar()
-                or 0
-            )
-            failed_searches = search_query.filter(AuditLog.success.is_(False)).count()
+            cutoff = _now_cached() - timedelta(days=days)
 
-            # Get top searches
-            top_searches = (
-                db.session.query(
-                    AuditLog.search_query,
-                    func.count(AuditLog.search_query).label("count"),
-                )
-                .filter(AuditLog.event_type == "search")
-                .filter(AuditLog.timestamp >= cutoff)
-                .group_by(AuditLog.search_query)
-                .order_by(desc("count"))
-                .limit(10)
-                .all()
-            )
+            row = db.session.execute(_SEARCH_STATISTICS_SQL, {"cutoff": cutoff}).one()
 
             return {
-                "total_searches": total_searches,
-                "unique_users": unique_users,
-                "unique_queries": unique_queries,
-                "avg_results": float(avg_results),
-                "failed_searches": failed_searches,
-                "top_searches": [
-                    {"search_query": q, "count": c} for q, c in top_searches
-                ],
+                "total_searches": row.total_searches,
+                "unique_users": row.unique_users,
+                "unique_queries": row.unique_queries,
+                "avg_results": float(row.avg_results or 0),
+                "failed_searches": row.failed_searches,
+                "top_searches": row.top_searches or [],
             }
         except Exception as e:
             logger.error(f"Failed to get search statistics: {e}")
@@ -389,80 +676,53 @@ class PostgresAuditService(IAuditLogger, IAuditQueryService):
                 "top_searches": [],
             }
 
-    def get_config_changes(self, days: int = 30) -> List[Dict[str, Any]]:
+    def get_config_changes(
+        self, days: int = 30, limit: int = MAX_REPORT_ROWS
+    ) -> List[Dict[str, Any]]:
         try:
-            cutoff = datetime.utcnow() - timedelta(days=days)
+            cutoff = _now_cached() - timedelta(days=days)
 
-            results = (
-                AuditLog.query.filter(AuditLog.event_type == "config")
-                .filter(AuditLog.timestamp >= cutoff)
+            return _stream_dicts(
+                select(*_AUDIT_COLUMNS)
+                .where(AuditLog.event_type == "config")
+                .where(AuditLog.timestamp >= cutoff)
                 .order_by(desc(AuditLog.timestamp))
-                .all()
+                .limit(limit),
+                _audit_dict,
             )
-            return [log.to_dict() for log in results]
         except Exception as e:
             logger.error(f"Failed to get config changes: {e}")
             return []
 
-    def get_errors(self, days: int = 7) -> List[Dict[str, Any]]:
+    def get_errors(
+        self, days: int = 7, limit: int = MAX_REPORT_ROWS
+    ) -> List[Dict[str, Any]]:
         try:
-            cutoff = datetime.utcnow() - timedelta(days=days)
+            cutoff = _now_cached() - timedelta(days=days)
 
-            results = (
-                ErrorLog.query.filter(ErrorLog.timestamp >= cutoff)
+            return _stream_dicts(
+                select(*_ERROR_COLUMNS)
+                .where(ErrorLog.timestamp >= cutoff)
                 .order_by(desc(ErrorLog.timestamp))
-                .all()
+                .limit(limit),
+                _error_dict,
             )
-            return [log.to_dict() for log in results]
         except Exception as e:
             logger.error(f"Failed to get errors: {e}")
             return []
 
     def get_error_statistics(self, days: int = 7) -> Dict[str, Any]:
         try:
-            cutoff = datetime.utcnow() - timedelta(days=days)
-
-            # Base query for errors
-            error_query = ErrorLog.query.filter(ErrorLog.timestamp >= cutoff)
-
-            # Get basic stats
-            total_errors = error_query.count()
-            unique_error_types = (
-                db.session.query(func.count(func.distinct(ErrorLog.error_type)))
-                .filter(ErrorLog.timestamp >= cutoff)
-                .scalar()
-            )
-            affected_users = (
-                db.session.query(func.count(func.distinct(ErrorLog.user_email)))
-                .filter(ErrorLog.timestamp >= cutoff)
-                .filter(ErrorLog.user_email.isnot(None))
-                .scalar()
-            )
-            affected_paths = (
-                db.session.query(func.count(func.distinct(ErrorLog.request_path)))
-                .filter(ErrorLog.timestamp >= cutoff)
-                .filter(ErrorLog.request_path.isnot(None))
-                .scalar()
-            )
+            cutoff = _now_cached() - timedelta(days=days)
 
-            # Get top errors
-            top_errors = (
-                db.session.query(
-                    ErrorLog.error_type, func.count(ErrorLog.error_type).label("count")
-                )
-                .filter(ErrorLog.timestamp >= cutoff)
-                .group_by(ErrorLog.error_type)
-                .order_by(desc("count"))
-                .limit(10)
-                .all()
-            )
+            row = db.session.execute(_ERROR_STATISTICS_SQL, {"cutoff": cutoff}).one()
 
             return {
-                "total_errors": total_errors,
-                "unique_error_types": unique_error_types,
-                "affected_users": affected_users,
-                "affected_paths": affected_paths,
-                "top_errors": [{"error_type": t, "count": c} for t, c in top_errors],
+                "total_errors": row.total_errors,
+                "unique_error_types": row.unique_error_types,
+                "affected_users": row.affected_users,
+                "affected_paths": row.affected_paths,
+                "top_errors": row.top_errors or [],
             }
         except Exception as e:
             logger.error(f"Failed to get error statistics: {e}")
@@ -0,0 +1,261 @@
+"""Background writer that batches audit_log inserts off the request path.
+
+Every ``AuditLog.log_*`` call used to pay a synchronous INSERT + COMMIT round
+trip inside the HTTP request. When this service is running it installs itself
+as the ``AuditLog`` row sink: rows are queued in-process and a daemon thread
+flushes them every ``flush_interval`` seconds (or as soon as ``batch_size``
+rows are waiting) with a single PostgreSQL ``COPY FROM STDIN``. Small batches
+use an executemany ``INSERT`` instead, where COPY's setup cost is not worth it.
+
+Lifecycle mirrors ``app/services/cache_cleanup_service.py`` (idempotent
+``start()``, daemon thread, app-context wrapped flushes). While the writer is
+stopped — including under TESTING, where ``create_app()`` never starts it —
+or when the queue is full, ``AuditLog`` falls back to synchronous saves, so
+audit rows are never dropped by back-pressure. A batch that fails to flush is
+retried, then written row by row through ``AuditLog.insert_row``; only rows
+the database rejects on their own are lost, and each is logged in full.
+"""
+
+import atexit
+import io
+import json
+import logging
+import queue
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from flask import Flask
+
+logger = logging.getLogger(__name__)
+
+# audit_log columns written by the batched path (id is left to the sequence)
+AUDIT_COPY_COLUMNS = (
+    "event_type",
+    "user_email",
+    "action",
+    "target_resource",
+    "user_role",
+    "ip_address",
+    "success",
+    "message",
+    "additional_data",
+    "session_id",
+    "user_agent",
+    "search_query",
+    "search_results_count",
+    "search_services",
+    "created_at",
+    "updated_at",
+)
+
+# Characters that must be backslash-escaped in COPY text format
+_COPY_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+def _copy_value(value: Any) -> str:
+    """Render one value in PostgreSQL COPY text format."""
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, (dict, list)):
+        value = json.dumps(value, default=str)
+    return str(value).translate(_COPY_ESCAPES)
+
+
+def build_copy_buffer(rows: List[Dict[str, Any]]) -> io.StringIO:
+    """Serialize audit row dicts into a tab-separated COPY buffer."""
+    buffer = io.StringIO()
+    for row in rows:
+        buffer.write("\t".join(_copy_value(row.get(col)) for col in AUDIT_COPY_COLUMNS))
+        buffer.write("\n")
+    buffer.seek(0)
+    return buffer
+
+
+class AuditWriter:
+    """Queue-backed batch writer for ``audit_log`` rows."""
+
+    # Batch flush attempts before falling back to row-by-row inserts
+    FLUSH_ATTEMPTS = 3
+
+    def __init__(
+        self,
+        app: Optional[Flask] = None,
+        batch_size: int = 200,
+        flush_interval: float = 0.5,
+        copy_threshold: int = 10,
+        max_queue_size: int = 10000,
+    ) -> None:
+        self.app = app
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        # Batches smaller than this use executemany instead of COPY
+        self.copy_threshold = copy_threshold
+        self.is_running = False
+        self.thread: Optional[threading.Thread] = None
+        self._queue: "queue.Queue[Dict[str, Any]]" = queue.Queue(maxsize=max_queue_size)
+        self._atexit_registered = False
+
+    def init_app(self, app: Flask) -> None:
+        """Bind a Flask app for the background thread's app_context wrapping."""
+        self.app = app
+
+    def start(self) -> None:
+        """Start the background writer thread and take over AuditLog inserts (idempotent)."""
+        if self.is_running:
+            logger.warning("Audit writer is already running")
+            return
+        if not self.app:
+            # Without an app the thread could not flush anything it queued
+            raise RuntimeError("Audit writer has no Flask app configured")
+
+        from app.models.audit import AuditLog
+
+        self.is_running = True
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+        AuditLog.set_row_sink(self.enqueue)
+        if not self._atexit_registered:
+            # Flush whatever is still queued when the worker process exits
+            atexit.register(self.stop)
+            self._atexit_registered = True
+        logger.info("Audit writer started")
+
+    def stop(self) -> None:
+        """Restore synchronous inserts, then drain the queue and stop the thread."""
+        from app.models.audit import AuditLog
+
+        AuditLog.set_row_sink(None)
+        if not self.is_running:
+            return
+        self.is_running = False
+        if self.thread:
+            self.thread.join(timeout=5)
+        logger.info("Audit writer stopped")
+
+    def enqueue(self, row: Dict[str, Any]) -> bool:
+        """Queue a row for the next flush.
+
+        Returns False when the writer is stopped or the queue is full so the
+        caller can write the row synchronously instead.
+        """
+        if not self.is_running:
+            return False
+        try:
+            self._queue.put_nowait(row)
+        except queue.Full:
+            logger.warning("Audit writer queue full; writing row synchronously")
+            return False
+        return True
+
+    def _run(self) -> None:
+        """Main loop: collect a batch → flush, until stopped and drained."""
+        while self.is_running or not self._queue.empty():
+            batch = self._collect_batch()
+            if not batch:
+                continue
+            try:
+                self._write_batch(batch)
+            except Exception as e:
+                # Never let the thread die
+                logger.error(
+                    f"Failed to write {len(batch)} audit rows: {str(e)}",
+                    exc_info=True,
+                )
+
+    def _write_batch(self, batch: List[Dict[str, Any]]) -> None:
+        """Flush ``batch``, retrying, then falling back to row-by-row inserts."""
+        if not self.app:
+            raise RuntimeError("Audit writer has no Flask app configured")
+        for attempt in range(1, self.FLUSH_ATTEMPTS + 1):
+            try:
+                with self.app.app_context():
+                    self._flush(batch)
+                return
+            except Exception as e:
+                logger.warning(
+                    f"Audit batch flush failed (attempt {attempt} of "
+                    f"{self.FLUSH_ATTEMPTS}): {str(e)}"
+                )
+                if attempt < self.FLUSH_ATTEMPTS:
+                    time.sleep(self.flush_interval * attempt)
+
+        # One bad row fails the whole statement; insert the rows one at a
+        # time so only a row the database rejects on its own is lost
+        from app.models.audit import AuditLog
+
+        with self.app.app_context():
+            for row in batch:
+                try:
+                    AuditLog.insert_row(row)
+                except Exception:
+                    logger.error(
+                        f"Dropped unwritable audit row: {row!r}", exc_info=True
+                    )
+
+    def _collect_batch(self) -> List[Dict[str, Any]]:
+        """Block for the first row, then gather more until size or time limit."""
+        try:
+            first = self._queue.get(timeout=self.flush_interval)
+        except queue.Empty:
+            return []
+
+        batch = [first]
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _flush(self, rows: List[Dict[str, Any]]) -> None:
+        """Write ``rows`` in one statement and commit."""
+        from app.database import db
+        from app.models.audit import AuditLog
+
+        try:
+            if len(rows) < self.copy_threshold:
+                db.session.execute(AuditLog.__table__.insert(), rows)
+            else:
+                dbapi_conn = db.session.connection().connection
+                cursor = dbapi_conn.cursor()
+                try:
+                    cursor.copy_expert(
+                        f"COPY {AuditLog.__tablename__} "
+                        f"({', '.join(AUDIT_COPY_COLUMNS)}) FROM STDIN",
+                        build_copy_buffer(rows),
+                    )
+                finally:
+                    cursor.close()
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+
+    def flush_now(self) -> int:
+        """Synchronously drain and write everything currently queued.
+
+        Runs in the caller's app context. Returns the number of rows written.
+        """
+        rows: List[Dict[str, Any]] = []
+        while True:
+            try:
+                rows.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        if rows:
+            self._flush(rows)
+        return len(rows)
+
+
+# Module-level instance shared by the container and create_app()
+audit_writer = AuditWriter()
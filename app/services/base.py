@@ -6,22 +6,44 @@ multiple services, reducing code duplication and ensuring consistency.
 """
 
 import logging
+import threading
+import time
 from abc import abstractmethod
-from typing import Optional, Dict, Any, List
-from datetime import datetime, timezone, timedelta
+from functools import cached_property
+from typing import Any, Dict, List, Optional, Tuple
+from datetime import datetime, timezone
+from http.cookiejar import DefaultCookiePolicy
 import requests
-from requests.exceptions import Timeout, ConnectionError
+from requests.adapters import HTTPAdapter
+from requests.exceptions import ConnectionError, RequestException, Timeout
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from urllib3.util.retry import Retry
 
+try:
+    import orjson  # type: ignore[import-not-found]
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+from app.database import db
 from app.services.configuration_service import config_get
 from app.utils.error_handler import handle_service_errors
 from app.interfaces.cache_repository import ICacheRepository
+from app.repositories.cache_repository import CacheRepository
 
 logger = logging.getLogger(__name__)
 
+# Sentinel for config cache misses (None is a legitimate cached value)
+_MISSING = object()
+
 
 class BaseConfigurableService:
     """Base class for services that use configuration."""
 
+    # Concrete services do not declare slots, so they keep a __dict__ (needed
+    # by cached_property and instance patching in tests); these only pin the
+    # base-class attributes to fixed offsets.
+    __slots__ = ("_config_prefix", "_service_label", "_config_cache", "_key_cache")
+
     def __init__(self, config_prefix: str):
         """
         Initialize with a configuration prefix.
@@ -30,7 +52,11 @@ class BaseConfigurableService:
             config_prefix: Prefix for configuration keys (e.g., 'genesys', 'graph')
         """
         self._config_prefix = config_prefix
+        # Display name used in user-facing error messages (e.g. "Genesys")
+        self._service_label = config_prefix.title()
         self._config_cache: Dict[str, Any] = {}
+        # key -> "prefix.key"; the set of keys per service is small and fixed
+        self._key_cache: Dict[str, str] = {}
 
     def _get_config(self, key: str, default: Any = None) -> Any:
         """
@@ -43,16 +69,33 @@ class BaseConfigurableService:
         Returns:
             Configuration value
         """
-        full_key = f"{self._config_prefix}.{key}"
+        full_key = self._key_cache.get(key)
+        if full_key is None:
+            full_key = self._key_cache[key] = f"{self._config_prefix}.{key}"
+        cache = self._config_cache
 
-        if full_key not in self._config_cache:
-            self._config_cache[full_key] = config_get(full_key, default)
+        value = cache.get(full_key, _MISSING)
+        if value is _MISSING:
+            raw = config_get(full_key, _MISSING)
+            value = cache[full_key] = default if raw is _MISSING else raw
 
-        return self._config_cache[full_key]
+        return value
+
+    # cached_property values derived from config; dropped on cache clear
+    _CACHED_CONFIG_PROPERTIES: Tuple[str, ...] = (
+        "timeout",
+        "base_url",
+        "cache_timeout",
+        "cache_refresh_period",
+    )
 
     def _clear_config_cache(self):
         """Clear the configuration cache to force reload."""
         self._config_cache.clear()
+        instance_dict = getattr(self, "__dict__", None)
+        if instance_dict:
+            for name in self._CACHED_CONFIG_PROPERTIES:
+                instance_dict.pop(name, None)
 
     def _load_config(self):
         """Load configuration - can be overridden by subclasses."""
@@ -63,6 +106,8 @@ class BaseConfigurableService:
 class BaseAPIService(BaseConfigurableService):
     """Base class for API-based services with common HTTP functionality."""
 
+    __slots__ = ("_session", "_bearer_fmt", "_timeout_msg_tpl")
+
     def __init__(self, config_prefix: str):
         """
         Initialize API service.
@@ -71,36 +116,66 @@ class BaseAPIService(BaseConfigurableService):
             config_prefix: Prefix for configuration keys
         """
         super().__init__(config_prefix)
-        self._base_url = None
+        self._session = self._create_session(config_prefix)
+        self._bearer_fmt = "Bearer {}".format
+        self._timeout_msg_tpl = (
+            f"{self._service_label} request timed out after {{}} seconds. "
+            "Please try again."
+        )
 
-    @property
+    @staticmethod
+    def _create_session(config_prefix: str) -> requests.Session:
+        """Build the pooled HTTP session shared by this service's requests.
+
+        Reusing one session keeps TCP/TLS connections alive between calls
+        instead of paying a fresh handshake per request. Failed connections
+        are retried for any method (nothing was sent); 502/503/504 only for
+        idempotent methods, so a POST is never replayed. Read timeouts are
+        not retried, so a slow call fails after one api_timeout rather than
+        blocking the caller for several. Retries back off exponentially; once
+        they run out, the last response is returned and raise_for_status()
+        surfaces it as an HTTPError. Cookies are not persisted, so requests
+        stay stateless. Static headers live on the session, so each request
+        only supplies Authorization.
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=Retry(
+                total=3,
+                connect=3,
+                read=0,
+                backoff_factor=0.3,
+                status_forcelist=(502, 503, 504),
+                raise_on_status=False,
+            ),
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        session.headers.update(
+            {
+                "Content-Type": "application/json",
+                "Accept": "application/json",
+                "User-Agent": f"WhoDis-Service/{config_prefix}",
+            }
+        )
+        return session
+
+    def close(self) -> None:
+        """Release pooled HTTP connections."""
+        self._session.close()
+
+    @cached_property
     def timeout(self) -> int:
         """Get API timeout in seconds."""
         return int(self._get_config("api_timeout", "15"))
 
-    @property
+    @cached_property
     def base_url(self) -> str:
         """Get base URL for API - can be overridden in subclasses."""
-        if self._base_url is None:
-            self._base_url = self._get_config("base_url", "")
-        return self._base_url or ""
-
-    def _get_headers(self, token: Optional[str] = None) -> Dict[str, str]:
-        """
-        Get standard headers for API requests.
-
-        Args:
-            token: Optional bearer token
-
-        Returns:
-            Headers dictionary
-        """
-        headers = {"Content-Type": "application/json", "Accept": "application/json"}
-
-        if token:
-            headers["Authorization"] = f"Bearer {token}"
-
-        return headers
+        return self._get_config("base_url", "") or ""
 
     @handle_service_errors(raise_errors=True)
     def _make_request(
@@ -126,44 +201,60 @@ class BaseAPIService(BaseConfigurableService):
         # Set defaults
         kwargs.setdefault("timeout", self.timeout)
 
-        # Add headers if not provided
-        if "headers" not in kwargs:
-            kwargs["headers"] = self._get_headers(token)
-        elif token and "Authorization" not in kwargs["headers"]:
-            kwargs["headers"]["Authorization"] = f"Bearer {token}"
+        # Content-Type/Accept come from the session; only add the bearer token
+        if token:
+            headers = kwargs.get("headers")
+            if headers is None:
+                kwargs["headers"] = {"Authorization": self._bearer_fmt(token)}
+            elif "Authorization" not in headers:
+                headers["Authorization"] = self._bearer_fmt(token)
 
         try:
-            logger.debug(f"{method} {url}")
-            response = requests.request(method, url, **kwargs)
+            logger.debug("%s %s", method, url)
+            response = self._session.request(method, url, **kwargs)
 
             # Log response status
-            logger.debug(f"Response: {response.status_code}")
+            status_code = response.status_code
+            logger.debug("Response: %s", status_code)
 
-            # Raise for HTTP errors
-            response.raise_for_status()
+            # Raise for HTTP errors; successful responses skip the call
+            if status_code >= 400:
+                if status_code == 401 and token:
+                    self._on_unauthorized(token)
+                response.raise_for_status()
 
             return response
 
-        except Timeout:
-            logger.error(f"Timeout after {self.timeout} seconds: {url}")
-            raise TimeoutError(
-                f"{self._config_prefix.title()} request timed out after {self.timeout} seconds. "
-                f"Please try again."
-            )
-        except ConnectionError as e:
-            logger.error(f"Connection error to {url}: {str(e)}")
-            raise ConnectionError(
-                f"Failed to connect to {self._config_prefix.title()} API"
-            )
-        except requests.HTTPError as e:
-            logger.error(
-                f"HTTP error from {url}: {e.response.status_code} - {e.response.text}"
-            )
+        except RequestException as e:
+            # One handler for the requests hierarchy; Timeout is checked first
+            # because ConnectTimeout is also a ConnectionError.
+            if isinstance(e, Timeout):
+                logger.error("Timeout after %s seconds: %s", self.timeout, url)
+                raise TimeoutError(self._timeout_msg_tpl.format(self.timeout)) from e
+            if isinstance(e, ConnectionError):
+                logger.error("Connection error to %s: %s", url, e)
+                raise ConnectionError(
+                    f"Failed to connect to {self._service_label} API"
+                ) from e
+            if isinstance(e, requests.HTTPError):
+                logger.error(
+                    "HTTP error from %s: %s - %s",
+                    url,
+                    e.response.status_code,
+                    _body_preview(e.response),
+                )
+            else:
+                logger.error(
+                    "Unexpected error making request to %s", url, exc_info=True
+                )
             raise
-        except Exception as e:
-            logger.error(f"Unexpected error making request to {url}: {str(e)}")
+        except Exception:
+            logger.error("Unexpected error making request to %s", url, exc_info=True)
             raise
 
+    def _on_unauthorized(self, token: str) -> None:
+        """Hook called when a bearer token is rejected with 401."""
+
     def _handle_response(self, response: requests.Response) -> Any:
         """
         Handle API response and extract JSON data.
@@ -175,15 +266,22 @@ class BaseAPIService(BaseConfigurableService):
             Parsed JSON data or None
         """
         try:
-            if response.status_code == 200:
+            if 200 <= response.status_code < 300:
+                content = response.content
+                if not content:
+                    return None
+                if orjson is not None:
+                    return orjson.loads(content)
                 return response.json()
             else:
                 logger.warning(
-                    f"API returned status {response.status_code}: {response.text}"
+                    "API returned status %s: %s",
+                    response.status_code,
+                    _body_preview(response),
                 )
                 return None
         except Exception as e:
-            logger.error(f"Error parsing response: {str(e)}")
+            logger.error("Error parsing response: %s", e)
             return None
 
     @abstractmethod
@@ -197,9 +295,23 @@ class BaseAPIService(BaseConfigurableService):
         pass
 
 
+def _default_cache_repository() -> ICacheRepository:
+    """Token cache used by services constructed without one (ApiToken table)."""
+    return CacheRepository()
+
+
 class BaseTokenService(BaseAPIService):
     """Base class for services with OAuth2 token management."""
 
+    __slots__ = (
+        "_token_service_name",
+        "_cache_repository",
+        "_mem_token",
+        "_mem_token_exp",
+        "_rejected_token",
+        "_token_lock",
+    )
+
     def __init__(
         self,
         config_prefix: str,
@@ -212,11 +324,27 @@ class BaseTokenService(BaseAPIService):
         Args:
             config_prefix: Prefix for configuration keys
             token_service_name: Name for token storage (e.g., 'genesys', 'microsoft_graph')
-            cache_repository: Repository for token caching (optional, uses default if None)
+            cache_repository: Repository for token caching (defaults to the
+                ApiToken-backed CacheRepository)
         """
         super().__init__(config_prefix)
         self._token_service_name = token_service_name
-        self._cache_repository = cache_repository
+        self._cache_repository = cache_repository or _default_cache_repository()
+        # In-process copy of the current token; expiry is in time.monotonic()
+        self._mem_token: Optional[str] = None
+        self._mem_token_exp: float = 0.0
+        # Token the API last answered 401 for; never reused from the cache
+        self._rejected_token: Optional[str] = None
+        # Serializes cache misses so concurrent callers share one OAuth fetch
+        self._token_lock = threading.Lock()
+
+    # Seconds before expiry at which the in-process token is no longer used
+    _TOKEN_EXPIRY_BUFFER = 60
+
+    def _remember_token(self, access_token: str, expires_in: float) -> None:
+        """Keep a token in-process so valid tokens skip the cache repository."""
+        self._mem_token = access_token
+        self._mem_token_exp = time.monotonic() + expires_in
 
     def _get_cached_token(self) -> Optional[str]:
         """
@@ -226,30 +354,33 @@ class BaseTokenService(BaseAPIService):
             Cached token if available and valid, None otherwise
         """
         try:
-            if self._cache_repository:
-                token_data = self._cache_repository.get_token(self._token_service_name)
-            else:
-                # Fallback to direct model access for backward compatibility
-                from flask import current_app
-
-                if current_app:
-                    from app.models.api_token import ApiToken
-
-                    token_data = ApiToken.get_token(self._token_service_name)
-                    if token_data and hasattr(token_data, "access_token"):
-                        logger.debug(
-                            f"Using cached {self._token_service_name} token from database"
-                        )
-                        return str(token_data.access_token)
-                else:
-                    return None
+            token_data = self._cache_repository.get_token(self._token_service_name)
+            if not token_data:
+                return None
+            # Repositories may return the token row or just the token string
+            access_token = str(getattr(token_data, "access_token", token_data))
+            if access_token == self._rejected_token:
+                logger.debug(
+                    "Ignoring rejected %s token from database", self._token_service_name
+                )
+                return None
+            expires_at = getattr(token_data, "expires_at", None)
+            if isinstance(expires_at, datetime):
+                if expires_at.tzinfo is None:
+                    expires_at = expires_at.replace(tzinfo=timezone.utc)
+                remaining = expires_at - datetime.now(timezone.utc)
+                self._remember_token(access_token, remaining.total_seconds())
+            logger.debug(
+                "Using cached %s token from database", self._token_service_name
+            )
+            return access_token
         except RuntimeError:
             logger.debug(
-                f"No Flask app context for {self._token_service_name} token lookup"
+                "No Flask app context for %s token lookup", self._token_service_name
             )
         except Exception as e:
             logger.error(
-                f"Error getting {self._token_service_name} token from database: {e}"
+                "Error getting %s token from database: %s", self._token_service_name, e
             )
 
         return None
@@ -262,30 +393,18 @@ class BaseTokenService(BaseAPIService):
             access_token: The access token to store
             expires_in: Token expiration time in seconds
         """
+        self._remember_token(access_token, expires_in)
         try:
-            if self._cache_repository:
-                self._cache_repository.cache_api_token(
-                    service_name=self._token_service_name,
-                    access_token=access_token,
-                    expires_in_seconds=expires_in,
-                )
-            else:
-                # Fallback to direct model access for backward compatibility
-                from flask import current_app
-
-                if current_app:
-                    from app.models.api_token import ApiToken
-
-                    ApiToken.upsert_token(
-                        service_name=self._token_service_name,
-                        access_token=access_token,
-                        expires_in_seconds=expires_in,
-                    )
-            logger.debug(f"Stored {self._token_service_name} token in database")
+            self._cache_repository.cache_api_token(
+                service_name=self._token_service_name,
+                access_token=access_token,
+                expires_in_seconds=expires_in,
+            )
+            logger.debug("Stored %s token in database", self._token_service_name)
         except RuntimeError:
             logger.debug("No Flask app context for token storage")
         except Exception as e:
-            logger.error(f"Error storing {self._token_service_name} token: {e}")
+            logger.error("Error storing %s token: %s", self._token_service_name, e)
 
     def _get_access_token(self) -> Optional[str]:
         """
@@ -294,14 +413,40 @@ class BaseTokenService(BaseAPIService):
         Returns:
             Access token or None if unable to obtain
         """
-        # Try cached token first
-        token = self._get_cached_token()
+        # In-process token first; lock-free while it is fresh
+        token = self._fresh_mem_token()
         if token:
             return token
 
-        # Fetch new token
-        logger.debug(f"Fetching new {self._token_service_name} token")
-        return self._fetch_new_token()
+        with self._token_lock:
+            # Another thread may have fetched a token while we waited
+            token = self._fresh_mem_token() or self._get_cached_token()
+            if token:
+                return token
+
+            # Fetch new token
+            logger.debug("Fetching new %s token", self._token_service_name)
+            return self._fetch_new_token()
+
+    def invalidate_token(self) -> None:
+        """Drop the in-process token so the next call goes back to the cache."""
+        self._mem_token = None
+        self._mem_token_exp = 0.0
+
+    def _on_unauthorized(self, token: str) -> None:
+        logger.debug("%s token rejected; invalidating", self._token_service_name)
+        # The cached row still holds this token, so skip it and fetch anew
+        self._rejected_token = token
+        self.invalidate_token()
+
+    def _fresh_mem_token(self) -> Optional[str]:
+        """Return the in-process token unless it is inside the expiry buffer."""
+        if (
+            self._mem_token
+            and time.monotonic() < self._mem_token_exp - self._TOKEN_EXPIRY_BUFFER
+        ):
+            return self._mem_token
+        return None
 
     @abstractmethod
     def _fetch_new_token(self) -> Optional[str]:
@@ -336,16 +481,39 @@ class BaseTokenService(BaseAPIService):
             token = self._get_access_token()
             return token is not None
         except Exception as e:
-            logger.error(f"Error refreshing {self._token_service_name} token: {str(e)}")
+            logger.error("Error refreshing %s token: %s", self._token_service_name, e)
             return False
 
 
-class BaseSearchService(BaseConfigurableService):
-    """Base class for services with user search functionality."""
+# Error bodies can be large JSON documents; only this much is logged
+_LOGGED_BODY_LIMIT = 512
 
-    def __init__(self, config_prefix: str):
-        """Initialize search service with configuration prefix."""
-        super().__init__(config_prefix)
+
+def _body_preview(response: requests.Response) -> str:
+    """First _LOGGED_BODY_LIMIT bytes of a response body, decoded for logging."""
+    body: bytes = response.content[:_LOGGED_BODY_LIMIT]
+    return body.decode("utf-8", errors="replace")
+
+
+def _format_multiple_results(
+    results: List[Dict[str, Any]], total: Optional[int] = None
+) -> Dict[str, Any]:
+    """Build the standard multiple-results payload; ``total`` defaults to len."""
+    return {
+        "multiple_results": True,
+        "results": results,
+        "total": total if total is not None else len(results),
+    }
+
+
+class _SearchMixin:
+    """Search helpers shared by search services.
+
+    Kept free of BaseConfigurableService so search can be combined with the
+    token service hierarchy without a second path to the config base class.
+    """
+
+    __slots__ = ()
 
     def _normalize_search_term(self, search_term: str) -> List[str]:
         """
@@ -357,22 +525,16 @@ class BaseSearchService(BaseConfigurableService):
         Returns:
             List of search term variations
         """
+        search_term = search_term.strip()
         variations = [search_term]
 
-        # Handle email addresses
+        # Handle email addresses; the username can never equal the full term
         if "@" in search_term:
-            username = search_term.split("@")[0]
-            variations.append(username)
-
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_variations = []
-        for v in variations:
-            if v not in seen:
-                seen.add(v)
-                unique_variations.append(v)
+            username = search_term.partition("@")[0].strip()
+            if username:
+                variations.append(username)
 
-        return unique_variations
+        return variations
 
     def _format_multiple_results(
         self, results: List[Dict[str, Any]], total: Optional[int] = None
@@ -387,11 +549,7 @@ class BaseSearchService(BaseConfigurableService):
         Returns:
             Formatted results dictionary
         """
-        return {
-            "multiple_results": True,
-            "results": results,
-            "total": total or len(results),
-        }
+        return _format_multiple_results(results, total)
 
     @abstractmethod
     def search_user(self, search_term: str) -> Optional[Dict[str, Any]]:
@@ -411,6 +569,8 @@ class BaseSearchService(BaseConfigurableService):
 class BaseCacheService(BaseConfigurableService):
     """Base class for services with database caching functionality."""
 
+    __slots__ = ()
+
     def __init__(self, config_prefix: str):
         """
         Initialize cache service.
@@ -420,12 +580,12 @@ class BaseCacheService(BaseConfigurableService):
         """
         super().__init__(config_prefix)
 
-    @property
+    @cached_property
     def cache_timeout(self) -> int:
         """Get cache timeout in seconds."""
         return int(self._get_config("cache_timeout", "30"))
 
-    @property
+    @cached_property
     def cache_refresh_period(self) -> int:
         """Get cache refresh period in seconds."""
         return int(self._get_config("cache_refresh_period", "21600"))  # 6 hours
@@ -435,18 +595,66 @@ class BaseCacheService(BaseConfigurableService):
         Check if cache needs refresh based on last update time.
 
         Args:
-            last_update: Last update timestamp
+            last_update: Last update timestamp (naive values are treated as UTC)
 
         Returns:
             True if cache needs refresh
         """
-        # Ensure timezone consistency
-        now = datetime.now(timezone.utc)
         if last_update.tzinfo is None:
             last_update = last_update.replace(tzinfo=timezone.utc)
+        return self.needs_refresh_epoch(last_update.timestamp())
+
+    def needs_refresh_epoch(self, last_update_epoch: float) -> bool:
+        """
+        Check if cache needs refresh given the last update as epoch seconds.
+
+        Callers that check repeatedly can keep the epoch next to their data
+        and skip the datetime conversion entirely.
 
-        time_since_update = now - last_update
-        return time_since_update > timedelta(seconds=self.cache_refresh_period)
+        Args:
+            last_update_epoch: Last update time as seconds since the epoch
+
+        Returns:
+            True if cache needs refresh
+        """
+        return (time.time() - last_update_epoch) > self.cache_refresh_period
+
+    def _bulk_upsert(
+        self,
+        table: Any,
+        rows: List[Dict[str, Any]],
+        conflict_cols: List[str],
+        update_cols: List[str],
+        commit: bool = True,
+    ) -> int:
+        """
+        Write cache rows in a single INSERT ... ON CONFLICT DO UPDATE.
+
+        Rows must not repeat a conflict key; PostgreSQL rejects a statement
+        that updates the same row twice.
+
+        Args:
+            table: Target Table (e.g. ``Model.__table__``)
+            rows: Column-name -> value dicts, one per row
+            conflict_cols: Columns of the unique constraint to upsert on
+            update_cols: Columns overwritten from the new row on conflict
+            commit: Commit the session after the statement
+
+        Returns:
+            Number of rows written
+        """
+        if not rows:
+            return 0
+
+        stmt = pg_insert(table).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=conflict_cols,
+            set_={col: stmt.excluded[col] for col in update_cols},
+        )
+        db.session.execute(stmt)
+        if commit:
+            db.session.commit()
+        return len(rows)
 
     @abstractmethod
     def refresh_cache(self) -> Dict[str, int]:
@@ -459,12 +667,24 @@ class BaseCacheService(BaseConfigurableService):
         pass
 
 
+class BaseSearchService(_SearchMixin, BaseConfigurableService):
+    """Base class for services with user search functionality."""
+
+    __slots__ = ()
+
+    def __init__(self, config_prefix: str):
+        """Initialize search service with configuration prefix."""
+        super().__init__(config_prefix)
+
+
 # Composite base classes for common combinations
 
 
-class BaseAPITokenService(BaseTokenService, BaseSearchService):
+class BaseAPITokenService(BaseTokenService, _SearchMixin):
     """Base class for API services with token management and search."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         config_prefix: str,
@@ -479,8 +699,4 @@ class BaseAPITokenService(BaseTokenService, BaseSearchService):
             token_service_name: Name for token storage
             cache_repository: Repository for token caching (optional, uses default if None)
         """
-        BaseTokenService.__init__(
-            self, config_prefix, token_service_name, cache_repository
-        )
-
-    # Inherits all functionality from both base classes
+        super().__init__(config_prefix, token_service_name, cache_repository)
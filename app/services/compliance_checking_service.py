@@ -6,10 +6,20 @@ against actual role assignments across all systems.
 """
 
 import logging
-from typing import Callable, Dict, Any, List, Optional, Set
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
+from typing import Callable, Dict, Any, Iterator, List, Optional, Set, Tuple
 from datetime import datetime, timezone, timedelta
 import uuid
 
+from flask import current_app
+from sqlalchemy import insert
+
 from app.database import db
 from app.services.base import BaseConfigurableService
 from app.utils.error_handler import handle_service_errors
@@ -24,6 +34,40 @@ from app.models.employee_profiles import EmployeeProfiles
 
 logger = logging.getLogger(__name__)
 
+# Rows removed per DELETE in cleanup_old_compliance_data
+_CLEANUP_CHUNK_SIZE = 10000
+
+# (system_name, role_name, mapping_type, priority, mapping_id)
+ExpectedRole = Tuple[str, str, str, int, int]
+
+
+# Priority buckets used by the severity table: <3, 3-4, >=5
+_LOW, _MID, _HIGH = 0, 1, 2
+
+# (compliance_status, priority bucket) -> violation severity
+_SEVERITY_TABLE: Dict[Tuple[str, int], str] = {
+    ("compliant", _LOW): "low",
+    ("compliant", _MID): "low",
+    ("compliant", _HIGH): "low",
+    ("has_prohibited", _LOW): "high",
+    ("has_prohibited", _MID): "critical",
+    ("has_prohibited", _HIGH): "critical",
+    ("missing_required", _LOW): "medium",
+    ("missing_required", _MID): "high",
+    ("missing_required", _HIGH): "critical",
+    ("unexpected_role", _LOW): "low",
+    ("unexpected_role", _MID): "medium",
+    ("unexpected_role", _HIGH): "medium",
+}
+
+# compliance_status -> remediation action
+_REMEDIATION_TABLE: Dict[str, str] = {
+    "compliant": "no_action",
+    "missing_required": "add_role",
+    "has_prohibited": "remove_role",
+    "unexpected_role": "manual_review",
+}
+
 
 class ComplianceCheckingService(BaseConfigurableService):
     """Service for performing job role compliance checks."""
@@ -45,26 +89,8 @@ class ComplianceCheckingService(BaseConfigurableService):
         Returns:
             Severity level (low, medium, high, critical)
         """
-        if compliance_status == "compliant":
-            return "low"  # Not actually a violation
-
-        # High severity violations
-        if compliance_status == "has_prohibited":
-            return "critical" if priority >= 3 else "high"
-
-        if compliance_status == "missing_required":
-            if priority >= 5:
-                return "critical"
-            elif priority >= 3:
-                return "high"
-            else:
-                return "medium"
-
-        # Unexpected roles are generally medium severity
-        if compliance_status == "unexpected_role":
-            return "medium" if priority >= 3 else "low"
-
-        return "medium"  # Default
+        bucket = _HIGH if priority >= 5 else _MID if priority >= 3 else _LOW
+        return _SEVERITY_TABLE.get((compliance_status, bucket), "medium")
 
     def _determine_remediation_action(
         self, compliance_status: str, mapping_type: Optional[str] = None
@@ -79,19 +105,7 @@ class ComplianceCheckingService(BaseConfigurableService):
         Returns:
             Remediation action string
         """
-        if compliance_status == "compliant":
-            return "no_action"
-
-        if compliance_status == "missing_required":
-            return "add_role"
-
-        if compliance_status == "has_prohibited":
-            return "remove_role"
-
-        if compliance_status == "unexpected_role":
-            return "manual_review"
-
-        return "manual_review"
+        return _REMEDIATION_TABLE.get(compliance_status, "manual_review")
 
     @handle_service_errors(raise_errors=True)
     def check_employee_compliance(
@@ -109,36 +123,102 @@ class ComplianceCheckingService(BaseConfigurableService):
         Returns:
             List of ComplianceCheck instances
         """
-        compliance_checks: List[ComplianceCheck] = []
+        compliance_checks = [
+            ComplianceCheck(**row)
+            for row in self._build_compliance_rows(employee_upn, job_code, run_id)
+        ]
+        db.session.add_all(compliance_checks)
+
+        if commit:
+            db.session.commit()
+
+        return compliance_checks
+
+    @staticmethod
+    def _expected_roles(mappings: List[JobRoleMapping]) -> List[ExpectedRole]:
+        """
+        Flatten mappings to plain tuples so later commits cannot expire them.
+
+        Args:
+            mappings: Active job role mappings with system_role loaded
+
+        Returns:
+            List of (system_name, role_name, mapping_type, priority, mapping_id)
+        """
+        return [
+            (
+                mapping.system_role.system_name,
+                mapping.system_role.role_name,
+                mapping.mapping_type,
+                mapping.priority,
+                mapping.id,
+            )
+            for mapping in mappings
+        ]
+
+    def _build_compliance_rows(
+        self,
+        employee_upn: str,
+        job_code: str,
+        run_id: str,
+        prefetched_mappings: Optional[List[ExpectedRole]] = None,
+        prefetched_assignments: Optional[List[EmployeeRoleAssignment]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Evaluate one employee's compliance as plain ComplianceCheck column dicts.
+
+        Args:
+            employee_upn: Employee UPN
+            job_code: Employee's job code
+            run_id: The compliance check run ID
+            prefetched_mappings: Active mappings for job_code as returned by
+                _expected_roles, if already loaded
+            prefetched_assignments: Active assignments for the employee, if
+                already loaded
+
+        Returns:
+            List of row dictionaries, one per check
+        """
+        rows: List[Dict[str, Any]] = []
 
         # Get expected mappings for this job code
-        expected_mappings = JobRoleMapping.get_active_mappings_for_job_code(job_code)
+        expected_mappings = prefetched_mappings
+        if expected_mappings is None:
+            expected_mappings = self._expected_roles(
+                JobRoleMapping.get_active_mappings_for_job_code(job_code)
+            )
         if not expected_mappings:
             logger.debug(f"No role mappings found for job code {job_code}")
-            return compliance_checks
+            return rows
 
         # Get actual role assignments for this employee
-        actual_assignments = EmployeeRoleAssignment.get_roles_for_employee(employee_upn)
-
-        # Group assignments by system for easier lookup
-        assignments_by_system: Dict[str, Set[str]] = {}
-        for assignment in actual_assignments:
-            system = assignment.system_name
-            if system not in assignments_by_system:
-                assignments_by_system[system] = set()
-            assignments_by_system[system].add(assignment.role_name)
-
-        # Check each expected mapping
-        for mapping in expected_mappings:
-            system_name = mapping.system_role.system_name
-            role_name = mapping.system_role.role_name
-            mapping_type = mapping.mapping_type
+        actual_assignments = prefetched_assignments
+        if actual_assignments is None:
+            actual_assignments = EmployeeRoleAssignment.get_roles_for_employee(
+                employee_upn
+            )
+
+        # (system, role) pairs, so each membership test is a single lookup
+        assigned_roles: Set[Tuple[str, str]] = {
+            (assignment.system_name, assignment.role_name)
+            for assignment in actual_assignments
+        }
+
+        # Check each expected mapping, collecting the expected roles in the
+        # same pass for the unexpected-role check below
+        expected_roles: Set[Tuple[str, str]] = set()
+        for (
+            system_name,
+            role_name,
+            mapping_type,
+            priority,
+            mapping_id,
+        ) in expected_mappings:
+            role_key = (system_name, role_name)
+            expected_roles.add(role_key)
 
             # Check if employee has this role
-            has_role = (
-                system_name in assignments_by_system
-                and role_name in assignments_by_system[system_name]
-            )
+            has_role = role_key in assigned_roles
 
             # Determine compliance status
             if mapping_type == "required":
@@ -150,43 +230,31 @@ class ComplianceCheckingService(BaseConfigurableService):
             else:
                 compliance_status = "unknown"
 
-            # Create compliance check record
-            check = ComplianceCheck(
-                check_run_id=run_id,
-                employee_upn=employee_upn,
-                job_code=job_code,
-                system_name=system_name,
-                role_name=role_name,
-                expected_mapping_type=mapping_type,
-                actual_assignment=has_role,
-                compliance_status=compliance_status,
-                violation_severity=self._determine_violation_severity(
-                    mapping_type, compliance_status, mapping.priority
-                ),
-                remediation_action=self._determine_remediation_action(
-                    compliance_status, mapping_type
-                ),
-                notes=f"Priority: {mapping.priority}, Mapping ID: {mapping.id}",
+            # Create compliance check row
+            rows.append(
+                dict(
+                    check_run_id=run_id,
+                    employee_upn=employee_upn,
+                    job_code=job_code,
+                    system_name=system_name,
+                    role_name=role_name,
+                    expected_mapping_type=mapping_type,
+                    actual_assignment=has_role,
+                    compliance_status=compliance_status,
+                    violation_severity=self._determine_violation_severity(
+                        mapping_type, compliance_status, priority
+                    ),
+                    remediation_action=self._determine_remediation_action(
+                        compliance_status, mapping_type
+                    ),
+                    notes=f"Priority: {priority}, Mapping ID: {mapping_id}",
+                )
             )
 
-            check.save(commit=False)
-            compliance_checks.append(check)
-
-        # Check for unexpected roles (roles not in any mapping)
-        expected_roles_by_system: Dict[str, Set[str]] = {}
-        for mapping in expected_mappings:
-            system = mapping.system_role.system_name
-            if system not in expected_roles_by_system:
-                expected_roles_by_system[system] = set()
-            expected_roles_by_system[system].add(mapping.system_role.role_name)
-
-        # Find unexpected roles
-        for system_name, assigned_roles in assignments_by_system.items():
-            expected_roles = expected_roles_by_system.get(system_name, set())
-            unexpected_roles = assigned_roles - expected_roles
-
-            for role_name in unexpected_roles:
-                check = ComplianceCheck(
+        # Find unexpected roles (roles not in any mapping)
+        for system_name, role_name in assigned_roles - expected_roles:
+            rows.append(
+                dict(
                     check_run_id=run_id,
                     employee_upn=employee_upn,
                     job_code=job_code,
@@ -203,14 +271,9 @@ class ComplianceCheckingService(BaseConfigurableService):
                     ),
                     notes="Role not defined in any job code mapping",
                 )
+            )
 
-                check.save(commit=False)
-                compliance_checks.append(check)
-
-        if commit:
-            db.session.commit()
-
-        return compliance_checks
+        return rows
 
     @handle_service_errors(raise_errors=True)
     def run_compliance_check(
@@ -248,64 +311,71 @@ class ComplianceCheckingService(BaseConfigurableService):
         check_run.save()
 
         try:
-            # Get employees to check based on scope
-            employees_to_check = self._get_employees_for_scope(scope, scope_filter)
-
-            check_run.total_employees = len(employees_to_check)
+            # Count employees up front; the employees themselves are paged in
+            # batch by batch below
+            total_employees = self._count_employees_for_scope(scope, scope_filter)
+            check_run.total_employees = total_employees
             check_run.save()
 
             logger.info(
-                f"Starting compliance check {run_id} for {len(employees_to_check)} employees"
+                f"Starting compliance check {run_id} for {total_employees} employees"
+            )
+
+            # Load the mappings for every job code in scope up front
+            # (flattened, since each batch commit expires ORM instances)
+            active_mappings = JobRoleMapping.get_active_mappings_for_job_codes(
+                self._get_job_codes_for_scope(scope, scope_filter)
             )
+            mappings_by_job_code = {
+                job_code: self._expected_roles(mappings)
+                for job_code, mappings in active_mappings.items()
+            }
 
-            # Process employees in batches for better performance
+            # Process employees in batches; batches are DB-bound, so a few run
+            # concurrently, each in its own app context and session
             batch_size = 50
+            max_workers = max(1, int(self._get_config("batch_workers", 4)))
+            app = current_app._get_current_object()  # type: ignore[attr-defined]
             total_checks = 0
             error_count = 0
-
-            for i in range(0, len(employees_to_check), batch_size):
-                batch = employees_to_check[i : i + batch_size]
-
-                try:
-                    # Process batch
-                    for employee_data in batch:
-                        employee_upn = employee_data["upn"]
-                        job_code = employee_data["job_code"]
-
-                        try:
-                            checks = self.check_employee_compliance(
-                                employee_upn=employee_upn,
-                                job_code=job_code,
-                                run_id=run_id,
-                                commit=False,
-                            )
-                            total_checks += len(checks)
-                        except Exception as e:
-                            logger.error(
-                                f"Error checking compliance for {employee_upn}: {str(e)}"
-                            )
-                            error_count += 1
-
-                    # Commit batch and update progress
-                    check_run.checked_count = min(
-                        i + batch_size, len(employees_to_check)
-                    )
-                    db.session.commit()
-                    logger.debug(
-                        f"Processed batch {i // batch_size + 1}, total checks: {total_checks}"
+            checked_count = 0
+
+            def record(future: Future, batch_len: int) -> None:
+                nonlocal total_checks, error_count, checked_count
+                batch_checks, batch_errors = future.result()
+                total_checks += batch_checks
+                error_count += batch_errors
+
+                # Update progress
+                checked_count += batch_len
+                check_run.checked_count = checked_count
+                db.session.commit()
+
+                if progress_callback:
+                    progress_callback(checked_count, total_employees)
+
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                pending: Dict[Future, int] = {}
+                batches = self._iter_employee_batches(scope, scope_filter, batch_size)
+                for batch_number, batch in enumerate(batches, 1):
+                    # Keep only a few batches queued so memory stays bounded
+                    while len(pending) >= max_workers * 2:
+                        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            record(future, pending.pop(future))
+
+                    future = executor.submit(
+                        self._process_batch,
+                        app,
+                        run_id,
+                        batch_number,
+                        batch,
+                        mappings_by_job_code,
                     )
+                    pending[future] = len(batch)
 
-                    if progress_callback:
-                        progress_callback(
-                            check_run.checked_count, len(employees_to_check)
-                        )
-
-                except Exception as e:
-                    logger.error(
-                        f"Error processing batch {i // batch_size + 1}: {str(e)}"
-                    )
-                    db.session.rollback()
-                    error_count += len(batch)
+                for future in as_completed(pending):
+                    record(future, pending[future])
 
             # Update run statistics
             check_run.total_checks = total_checks
@@ -324,20 +394,92 @@ class ComplianceCheckingService(BaseConfigurableService):
 
         return check_run
 
-    def _get_employees_for_scope(
-        self, scope: str, scope_filter: Optional[str] = None
-    ) -> List[Dict[str, str]]:
+    def _process_batch(
+        self,
+        app: Any,
+        run_id: str,
+        batch_number: int,
+        batch: List[Dict[str, str]],
+        mappings_by_job_code: Dict[str, List[ExpectedRole]],
+    ) -> Tuple[int, int]:
         """
-        Get list of employees to check based on scope.
+        Check and store one batch of employees in a worker thread.
+
+        Args:
+            app: Flask application to push a context for
+            run_id: The compliance check run ID
+            batch_number: 1-based batch number, for logging
+            batch: Employee dictionaries with upn and job_code
+            mappings_by_job_code: Flattened active mappings keyed by job code
+
+        Returns:
+            Tuple of (checks written, employees that errored)
+        """
+        with app.app_context():
+            try:
+                # Collect plain rows for one bulk insert
+                batch_rows: List[Dict[str, Any]] = []
+                error_count = 0
+                assignments_by_upn = EmployeeRoleAssignment.get_roles_for_employees(
+                    employee["upn"] for employee in batch
+                )
+                for employee_data in batch:
+                    employee_upn = employee_data["upn"]
+                    job_code = employee_data["job_code"]
+
+                    try:
+                        batch_rows.extend(
+                            self._build_compliance_rows(
+                                employee_upn=employee_upn,
+                                job_code=job_code,
+                                run_id=run_id,
+                                prefetched_mappings=mappings_by_job_code.get(
+                                    job_code, []
+                                ),
+                                prefetched_assignments=assignments_by_upn.get(
+                                    employee_upn, []
+                                ),
+                            )
+                        )
+                    except Exception as e:
+                        logger.error(
+                            f"Error checking compliance for {employee_upn}: {str(e)}"
+                        )
+                        error_count += 1
+
+                if batch_rows:
+                    db.session.execute(insert(ComplianceCheck), batch_rows)
+                db.session.commit()
+                logger.debug(
+                    f"Processed batch {batch_number}, checks: {len(batch_rows)}"
+                )
+                return len(batch_rows), error_count
+
+            except Exception as e:
+                logger.error(f"Error processing batch {batch_number}: {str(e)}")
+                db.session.rollback()
+                return 0, len(batch)
+
+    def _scope_query(self, scope: str, scope_filter: Optional[str] = None):
+        """
+        Build the (upn, job_code) query for employees in a check scope.
 
         Args:
             scope: Scope type
             scope_filter: Filter criteria
 
         Returns:
-            List of employee dictionaries with upn and job_code
+            Query selecting EmployeeProfiles.upn and ukg_job_code
         """
-        query = EmployeeProfiles.query.filter(EmployeeProfiles.ukg_job_code.isnot(None))
+        # Select only the two columns needed rather than whole profile rows
+        query = db.session.query(
+            EmployeeProfiles.upn, EmployeeProfiles.ukg_job_code
+        ).filter(
+            EmployeeProfiles.upn.isnot(None),
+            EmployeeProfiles.upn != "",
+            EmployeeProfiles.ukg_job_code.isnot(None),
+            EmployeeProfiles.ukg_job_code != "",
+        )
 
         if scope == "department" and scope_filter:
             # Filter by department - need to join with job codes table
@@ -351,14 +493,63 @@ class ComplianceCheckingService(BaseConfigurableService):
         elif scope == "individual" and scope_filter:
             query = query.filter(EmployeeProfiles.upn == scope_filter)
 
-        # Get results
-        employees = query.all()
+        return query
 
-        return [
-            {"upn": emp.upn, "job_code": emp.ukg_job_code}
-            for emp in employees
-            if emp.upn and emp.ukg_job_code
-        ]
+    def _count_employees_for_scope(
+        self, scope: str, scope_filter: Optional[str] = None
+    ) -> int:
+        """Count employees in a check scope with a single COUNT query."""
+        return int(
+            self._scope_query(scope, scope_filter)
+            .with_entities(db.func.count(EmployeeProfiles.upn))
+            .scalar()
+            or 0
+        )
+
+    def _get_job_codes_for_scope(
+        self, scope: str, scope_filter: Optional[str] = None
+    ) -> List[str]:
+        """Get the distinct job codes held by employees in a check scope."""
+        query = (
+            self._scope_query(scope, scope_filter)
+            .with_entities(EmployeeProfiles.ukg_job_code)
+            .distinct()
+        )
+        return [job_code for (job_code,) in query]
+
+    def _iter_employee_batches(
+        self, scope: str, scope_filter: Optional[str], batch_size: int
+    ) -> Iterator[List[Dict[str, str]]]:
+        """
+        Page through employees in a check scope, one batch per query.
+
+        Pages are keyed on UPN rather than held open as a cursor, so callers
+        can commit between batches.
+
+        Args:
+            scope: Scope type
+            scope_filter: Filter criteria
+            batch_size: Employees per batch
+
+        Yields:
+            Lists of employee dictionaries with upn and job_code
+        """
+        query = self._scope_query(scope, scope_filter).order_by(EmployeeProfiles.upn)
+        last_upn: Optional[str] = None
+
+        while True:
+            page = query
+            if last_upn is not None:
+                page = page.filter(EmployeeProfiles.upn > last_upn)
+            rows = page.limit(batch_size).all()
+            if not rows:
+                return
+
+            yield [{"upn": upn, "job_code": job_code} for upn, job_code in rows]
+
+            if len(rows) < batch_size:
+                return
+            last_upn = rows[-1][0]
 
     def get_compliance_summary(self, run_id: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -385,32 +576,46 @@ class ComplianceCheckingService(BaseConfigurableService):
             if not check_run:
                 return {"error": "No completed compliance runs found"}
 
-        # Get compliance checks for this run
-        checks = ComplianceCheck.query.filter_by(check_run_id=check_run.run_id).all()
-
-        # Calculate statistics
-        total_checks = len(checks)
-        compliant_checks = sum(1 for c in checks if c.compliance_status == "compliant")
+        # Aggregate in the database instead of loading every check row
+        is_compliant = ComplianceCheck.compliance_status == "compliant"
+        total_checks, compliant_checks = (
+            db.session.query(
+                db.func.count(ComplianceCheck.id),
+                db.func.coalesce(db.func.sum(db.case((is_compliant, 1), else_=0)), 0),
+            )
+            .filter(ComplianceCheck.check_run_id == check_run.run_id)
+            .one()
+        )
         violation_checks = total_checks - compliant_checks
 
-        # Group violations by type
+        # Group violations by type, severity and system in one pass
         violation_types: Dict[str, int] = {}
         severity_counts: Dict[str, int] = {}
         system_violations: Dict[str, int] = {}
 
-        for check in checks:
-            if check.compliance_status != "compliant":
-                # Count by violation type
-                status = check.compliance_status
-                violation_types[status] = violation_types.get(status, 0) + 1
-
-                # Count by severity
-                severity = check.violation_severity
-                severity_counts[severity] = severity_counts.get(severity, 0) + 1
+        violation_groups = (
+            db.session.query(
+                ComplianceCheck.compliance_status,
+                ComplianceCheck.violation_severity,
+                ComplianceCheck.system_name,
+                db.func.count(ComplianceCheck.id),
+            )
+            .filter(
+                ComplianceCheck.check_run_id == check_run.run_id,
+                ComplianceCheck.compliance_status != "compliant",
+            )
+            .group_by(
+                ComplianceCheck.compliance_status,
+                ComplianceCheck.violation_severity,
+                ComplianceCheck.system_name,
+            )
+            .all()
+        )
 
-                # Count by system
-                system = check.system_name
-                system_violations[system] = system_violations.get(system, 0) + 1
+        for status, severity, system, count in violation_groups:
+            violation_types[status] = violation_types.get(status, 0) + count
+            severity_counts[severity] = severity_counts.get(severity, 0) + count
+            system_violations[system] = system_violations.get(system, 0) + count
 
         # Get top violating job codes
         job_code_violations = (
@@ -486,12 +691,9 @@ class ComplianceCheckingService(BaseConfigurableService):
         compliance_score = 0
 
         for check in latest_checks:
-            system = check.system_name
-            if system not in checks_by_system:
-                checks_by_system[system] = []
-
-            check_data = check.to_dict_with_employee_info()
-            checks_by_system[system].append(check_data)
+            # Reuse the profile loaded above rather than one query per check
+            check_data = check.to_dict_with_employee_info(profile=profile)
+            checks_by_system.setdefault(check.system_name, []).append(check_data)
 
             if check.compliance_status == "compliant":
                 compliance_score += 1
@@ -545,21 +747,26 @@ class ComplianceCheckingService(BaseConfigurableService):
         # In a production environment, this would use Celery or similar
         import threading
 
+        app = current_app._get_current_object()  # type: ignore[attr-defined]
+
         def run_check():
             if delay_seconds > 0:
                 import time
 
                 time.sleep(delay_seconds)
 
-            try:
-                self.run_compliance_check(
-                    scope=scope,
-                    scope_filter=scope_filter,
-                    run_type="scheduled",
-                    started_by="scheduler",
-                )
-            except Exception as e:
-                logger.error(f"Error in scheduled compliance check: {str(e)}")
+            # The thread needs its own app context (and so its own session);
+            # the request that scheduled it may be long gone
+            with app.app_context():
+                try:
+                    self.run_compliance_check(
+                        scope=scope,
+                        scope_filter=scope_filter,
+                        run_type="scheduled",
+                        started_by="scheduler",
+                    )
+                except Exception as e:
+                    logger.error(f"Error in scheduled compliance check: {str(e)}")
 
         # Generate run ID for tracking
         run_id = f"scheduled_{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}"
@@ -583,16 +790,28 @@ class ComplianceCheckingService(BaseConfigurableService):
         """
         cutoff_date = datetime.now(timezone.utc) - timedelta(days=days_to_keep)
 
-        # Delete old compliance checks
-        deleted_checks = ComplianceCheck.query.filter(
-            ComplianceCheck.created_at < cutoff_date
-        ).delete()
+        # Delete old compliance checks in chunks so no single transaction
+        # holds locks on the whole expired range
+        deleted_checks = 0
+        while True:
+            expired_ids = (
+                db.select(ComplianceCheck.id)
+                .where(ComplianceCheck.created_at < cutoff_date)
+                .limit(_CLEANUP_CHUNK_SIZE)
+            )
+            deleted = ComplianceCheck.query.filter(
+                ComplianceCheck.id.in_(expired_ids)
+            ).delete(synchronize_session=False)
+            db.session.commit()
+            deleted_checks += deleted
+            if deleted < _CLEANUP_CHUNK_SIZE:
+                break
 
         # Delete old completed runs
         deleted_runs = ComplianceCheckRun.query.filter(
             ComplianceCheckRun.completed_at < cutoff_date,
             ComplianceCheckRun.status == "completed",
-        ).delete()
+        ).delete(synchronize_session=False)
 
         db.session.commit()
 
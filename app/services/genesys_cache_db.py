@@ -48,14 +48,6 @@ class GenesysCacheDB(BaseCacheService):
         api_domain = self._region_api_mapping.get(self.region, f"api.{self.region}")
         return f"https://{api_domain}"
 
-    @property
-    def cache_timeout(self):
-        return int(self._get_config("cache_timeout", "30"))
-
-    @property
-    def cache_refresh_period(self):
-        return int(self._get_config("cache_refresh_period", "21600"))  # 6 hours
-
     def _get_access_token(self) -> Optional[str]:
         """
         Legacy database token lookup (fallback only).
@@ -177,6 +169,28 @@ class GenesysCacheDB(BaseCacheService):
         logger.info(f"Cache refresh completed: {results}")
         return results
 
+    def _store_entities(self, data_type: str, entities: list) -> int:
+        """Upsert one page of (raw entity, name, description) in one statement."""
+        rows = {}
+        for entity, name, description in entities:
+            # Last occurrence wins, matching the old row-by-row update order
+            rows[entity.get("id")] = {
+                "service_name": "genesys",
+                "data_type": data_type,
+                "service_id": entity.get("id"),
+                "name": name,
+                "description": description,
+                "raw_data": entity,
+                "is_active": bool(entity.get("active", entity.get("enabled", True))),
+            }
+        return self._bulk_upsert(
+            ExternalServiceData.__table__,
+            list(rows.values()),
+            conflict_cols=["service_name", "data_type", "service_id"],
+            update_cols=["name", "description", "raw_data", "is_active", "updated_at"],
+            commit=False,
+        )
+
     def _refresh_groups(self, token: str) -> int:
         """Refresh groups cache."""
         try:
@@ -210,16 +224,13 @@ class GenesysCacheDB(BaseCacheService):
                     ).delete()
 
                 # Insert new data
-                for group in entities:
-                    ExternalServiceData.update_service_data(
-                        service_name="genesys",
-                        data_type="group",
-                        service_id=group.get("id"),
-                        name=group.get("name"),
-                        description=group.get("description"),
-                        raw_data=group,
-                    )
-                    count += 1
+                count += self._store_entities(
+                    "group",
+                    [
+                        (group, group.get("name"), group.get("description"))
+                        for group in entities
+                    ],
+                )
 
                 db.session.commit()
 
@@ -270,15 +281,9 @@ class GenesysCacheDB(BaseCacheService):
                     ).delete()
 
                 # Insert new data
-                for skill in entities:
-                    ExternalServiceData.update_service_data(
-                        service_name="genesys",
-                        data_type="skill",
-                        service_id=skill.get("id"),
-                        name=skill.get("name"),
-                        raw_data=skill,
-                    )
-                    count += 1
+                count += self._store_entities(
+                    "skill", [(skill, skill.get("name"), None) for skill in entities]
+                )
 
                 db.session.commit()
 
@@ -329,6 +334,7 @@ class GenesysCacheDB(BaseCacheService):
                     ).delete()
 
                 # Insert new data
+                locations = []
                 for location in entities:
                     # Build address string
                     address_parts = []
@@ -342,15 +348,8 @@ class GenesysCacheDB(BaseCacheService):
                             address_parts.append(addr["state"])
 
                     address_str = ", ".join(address_parts) if address_parts else None
-                    ExternalServiceData.update_service_data(
-                        service_name="genesys",
-                        data_type="location",
-                        service_id=location.get("id"),
-                        name=location.get("name"),
-                        description=address_str,
-                        raw_data=location,
-                    )
-                    count += 1
+                    locations.append((location, location.get("name"), address_str))
+                count += self._store_entities("location", locations)
 
                 db.session.commit()
 
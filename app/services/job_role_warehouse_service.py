@@ -6,6 +6,7 @@ and employee assignments for compliance checking.
 """
 
 import logging
+from functools import cached_property
 from typing import Any, Dict, List, Optional
 from datetime import datetime, timezone
 
@@ -76,7 +77,17 @@ class JobRoleWarehouseService(BaseAPIService):
         """Get query timeout in seconds."""
         return int(self._get_config("query_timeout", "60"))
 
+    # Dropped along with the config cache by _clear_config_cache
+    _CACHED_CONFIG_PROPERTIES = BaseAPIService._CACHED_CONFIG_PROPERTIES + (
+        "_connection_string",
+    )
+
     def _get_connection_string(self) -> str:
+        """Return the Azure SQL connection string, built once per config load."""
+        return self._connection_string
+
+    @cached_property
+    def _connection_string(self) -> str:
         """Build Azure SQL connection string with AD authentication."""
         driver = "ODBC Driver 18 for SQL Server"
 
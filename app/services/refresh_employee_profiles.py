@@ -3,7 +3,8 @@
 import asyncio
 import logging
 from contextlib import nullcontext
-from typing import List, Dict, Any, Optional
+from functools import cached_property
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 from datetime import datetime, timezone
 
 try:
@@ -28,6 +29,185 @@ except ImportError:  # pragma: no cover - Flask is a hard dependency
 
 logger = logging.getLogger(__name__)
 
+# Rows pulled per fetchmany() round trip from the data warehouse
+_FETCH_BATCH_SIZE = 1000
+
+# Keystone role expected for each UKG job code, in the order the mapping was
+# written; a code listed twice keeps its first role (as the old SQL CASE did)
+_EXPECTED_ROLE_JOB_CODES: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("Accounting Mgmt", ("81015", "81014", "81004", "81030", "81003")),
+    (
+        "Inquiry",
+        (
+            "80008",
+            "78004",
+            "780010",
+            "76012",
+            "88016",
+            "78006",
+            "78008",
+            "78016",
+            "76013",
+            "76008",
+            "74033",
+            "90006",
+            "78030",
+            "78013",
+            "78010",
+            "76011",
+            "74047",
+            "74036",
+            "74046",
+            "74039",
+            "74038",
+            "74034",
+            "74048",
+            "74045",
+            "74037",
+            "74042",
+            "74041",
+            "74049",
+            "74040",
+            "74043",
+            "74044",
+            "76002",
+            "74032",
+            "74035",
+            "76004",
+        ),
+    ),
+    ("Branch Head Teller", ("1111",)),
+    (
+        "Branch Management/Lead CUA",
+        ("3102", "7103", "1101", "11005", "11006", "11007", "11008"),
+    ),
+    ("Branch Ops Upper Mgmt", ("73008", "73006", "73001", "73003")),
+    ("Not Determined", ("1115", "87001", "90007", "83009", "85031", "78003", "9999")),
+    ("Branch CUA 1", ("1112",)),
+    ("CUA 1", ("1116", "11001")),
+    ("Branch Supervisor/Branch CUA 3", ("5110", "11003")),
+    (
+        "Inquiry-Audit",
+        (
+            "77009",
+            "77015",
+            "77011",
+            "77014",
+            "71011",
+            "71010",
+            "77012",
+            "88004",
+            "90002",
+            "72030",
+            "77010",
+            "72010",
+            "77008",
+            "77007",
+            "77006",
+            "88008",
+            "88007",
+            "88006",
+            "70001",
+            "84030",
+            "77016",
+            "77003",
+        ),
+    ),
+    (
+        "No Access Granted",
+        (
+            "78012",
+            "9999INT",
+            "8",
+            "13",
+            "15",
+            "16",
+            "76014",
+            "76005",
+            "76003",
+            "76007",
+            "76006",
+            "77013",
+            "1",
+            "74001",
+            "84012",
+            "3",
+            "3117",
+            "76010",
+            "10",
+            "4",
+            "6",
+            "11",
+            "10001",
+            "9999EXT",
+        ),
+    ),
+    ("Payment Solutions Sr Rep", ("86010", "86007")),
+    ("Consumer Credit Card Rep", ("79012", "79015")),
+    (
+        "Consumer Mgmt 1",
+        ("79005", "79011", "80015", "80025", "73015", "80009", "80007"),
+    ),
+    ("Consumer Rep 1", ("79009", "79010")),
+    ("Consumer Rep 2", ("79008", "80050", "80011", "73014")),
+    ("Consumer Rep 3", ("79007", "80010", "73016")),
+    ("Consumer Mgmt 2", ("79030", "80002", "80020", "79031", "80004")),
+    ("Branch CUA 2", ("1118", "11002")),
+    ("VRC CUA 4", ("11004",)),
+    ("E-Services Supervisor", ("89153", "89154", "89132", "89152")),
+    ("IT Security", ("84006", "84033", "84031", "84032")),
+    ("IT System Admin", ("84040", "84009", "84008", "84015", "84035")),
+    ("IT Developer", ("84025", "84028")),
+    ("IT Business Analyst", ("84018", "84021", "84022", "84020")),
+    ("IT Service Desk", ("84005", "84010", "84014")),
+    ("Mortgage Mgmt 2", ("79032", "85003")),
+    ("Branch Management/Lead CUA OR VRC Upper Management", ("11007",)),
+    ("MRC Manager", ("83004",)),
+    ("Payment Solutions Supervisor", ("86004", "86006", "86005")),
+    ("Payment Solutions Rep", ("86009", "86008")),
+    ("Branch District Management", ("73005",)),
+    (
+        "Loss Mitigation Supervisor",
+        ("87020", "87003", "87006", "87002", "870010", "87021"),
+    ),
+    ("Loss Mitigation Member Advocate/Rep", ("87017", "87019")),
+    ("Loss Mitigation - Specialized", ("87014", "87011", "87018")),
+    ("Strat-Mgmt", ("90008",)),
+    ("E-Services Rep", ("89120", "83030")),
+    ("MRC I", ("83007", "83011")),
+    ("MRC II", ("83008",)),
+    ("MRC Supervisor", ("83006", "83025")),
+    (
+        "Mortgage Rep 3",
+        (
+            "85008",
+            "85041",
+            "85022",
+            "85006",
+            "85007",
+            "85012",
+            "85018",
+            "85019",
+            "85002",
+            "85032",
+        ),
+    ),
+    ("Mortgage Rep 2", ("85020", "85024", "85013", "85016", "85017", "85011", "85036")),
+    ("Mortgage Rep 1", ("85010", "85030")),
+    ("Mortgage Mgmt 1", ("85025",)),
+    ("Senior Lending Management", ("79040",)),
+    ("VRC Teller", ("117",)),
+    ("VRC Upper Management", ("73009",)),
+    ("MRC Supervisor", ("83010",)),
+)
+
+# Built in reverse so the first listing of a code wins
+_EXPECTED_ROLE_BY_JOB_CODE: Dict[str, str] = {
+    job_code: role
+    for role, job_codes in reversed(_EXPECTED_ROLE_JOB_CODES)
+    for job_code in job_codes
+}
+
 
 class EmployeeProfilesRefreshService(BaseConfigurableService):
     """Service for refreshing employee profiles from Azure SQL and Graph API."""
@@ -84,7 +264,17 @@ class EmployeeProfilesRefreshService(BaseConfigurableService):
         """Get cache refresh period in hours."""
         return float(self._get_config("cache_refresh_hours", "6.0"))
 
+    # Dropped along with the config cache by _clear_config_cache
+    _CACHED_CONFIG_PROPERTIES = BaseConfigurableService._CACHED_CONFIG_PROPERTIES + (
+        "_connection_string",
+    )
+
     def _get_connection_string(self) -> str:
+        """Return the Azure SQL connection string, built once per config load."""
+        return self._connection_string
+
+    @cached_property
+    def _connection_string(self) -> str:
         """Build Azure SQL connection string with AD authentication."""
         driver = "ODBC Driver 18 for SQL Server"
 
@@ -105,9 +295,6 @@ class EmployeeProfilesRefreshService(BaseConfigurableService):
     @handle_service_errors(raise_errors=True)
     def test_connection(self) -> bool:
         """Test connection to Azure SQL Server."""
-        # Clear cache to force reload of configuration
-        self._clear_config_cache()
-
         # Check if credentials are configured
         client_id = self.client_id
         client_secret = self.client_secret
@@ -152,9 +339,22 @@ class EmployeeProfilesRefreshService(BaseConfigurableService):
         Returns:
             List of user records from the data warehouse
         """
+        return list(self.iter_keystone_records())
+
+    def iter_keystone_records(self) -> Iterator[Dict[str, Any]]:
+        """
+        Execute the Keystone user query and yield records as they are fetched.
+
+        Rows are pulled from the cursor in batches, so only one batch of raw
+        rows is held at a time. The connection stays open until the generator
+        is exhausted or closed.
+
+        Yields:
+            User records from the data warehouse
+        """
         if pyodbc is None:
             logger.error("pyodbc not available - cannot execute keystone query")
-            return []
+            return
 
         query = """
         SELECT
@@ -164,58 +364,7 @@ class EmployeeProfilesRefreshService(BaseConfigurableService):
             Employee.UPN,
             RoleDesc.[DESCRIPTION] AS Live_Role,
             TestRoleDesc.[DESCRIPTION] AS Test_Role,
-            Employee.[JobCode] AS UKG_Job_Code,
-            CASE
-                WHEN Employee.JobCode IN ('81015','81014','81004','81030','81003') THEN 'Accounting Mgmt'
-                WHEN Employee.JobCode IN ('80008','78004','780010','76012','88016','78006','78008','78016','76013','76008','74033','90006','78030','78013','78010','76011','74047','74036','74046','74039','74038','74034','74048','74045','74037','74042','74041','74049','74040','74043','74044','76002','74032','74035','76004') THEN 'Inquiry'
-                WHEN Employee.JobCode IN ('1111') THEN 'Branch Head Teller'
-                WHEN Employee.JobCode IN ('3102','7103','1101','11005','11006','11007','11008') THEN 'Branch Management/Lead CUA'
-                WHEN Employee.JobCode IN ('73008','73006','73001','73003') THEN 'Branch Ops Upper Mgmt'
-                WHEN Employee.JobCode IN ('1115','87001','90007','83009','85031','78003','9999') THEN 'Not Determined'
-                WHEN Employee.JobCode IN ('1112') THEN 'Branch CUA 1'
-                WHEN Employee.JobCode IN ('1116','11001') THEN 'CUA 1'
-                WHEN Employee.JobCode IN ('5110','11003') THEN 'Branch Supervisor/Branch CUA 3'
-                WHEN Employee.JobCode IN ('77009','77015','77011','77014','71011','71010','77012','88004','90002','72030','77010','72010','77008','77007','77006','88008','88007','88006','70001','84030','77016','77003') THEN 'Inquiry-Audit'
-                WHEN Employee.JobCode IN ('78012','9999INT','8','13','15','16','76014','76005','76003','76007','76006','77013','1','74001','84012','3','3117','76010','10','4','6','11','10001','9999EXT') THEN 'No Access Granted'
-                WHEN Employee.JobCode IN ('86010','86007') THEN 'Payment Solutions Sr Rep'
-                WHEN Employee.JobCode IN ('79012','79015') THEN 'Consumer Credit Card Rep'
-                WHEN Employee.JobCode IN ('79005','79011','80015','80025','73015','80009','80007') THEN 'Consumer Mgmt 1'
-                WHEN Employee.JobCode IN ('79009','79010') THEN 'Consumer Rep 1'
-                WHEN Employee.JobCode IN ('79008','80050','80011','73014') THEN 'Consumer Rep 2'
-                WHEN Employee.JobCode IN ('79007','80010','73016') THEN 'Consumer Rep 3'
-                WHEN Employee.JobCode IN ('79030','80002','80020','79031','80004') THEN 'Consumer Mgmt 2'
-                WHEN Employee.JobCode IN ('1118','11002') THEN 'Branch CUA 2'
-                WHEN Employee.JobCode IN ('11004') THEN 'VRC CUA 4'
-                WHEN Employee.JobCode IN ('89153','89154','89132','89152') THEN 'E-Services Supervisor'
-                WHEN Employee.JobCode IN ('84006','84033','84031','84032') THEN 'IT Security'
-                WHEN Employee.JobCode IN ('84040','84009','84008','84015','84035') THEN 'IT System Admin'
-                WHEN Employee.JobCode IN ('84025','84028') THEN 'IT Developer'
-                WHEN Employee.JobCode IN ('84018','84021','84022','84020') THEN 'IT Business Analyst'
-                WHEN Employee.JobCode IN ('84005','84010','84014') THEN 'IT Service Desk'
-                WHEN Employee.JobCode IN ('79032','85003') THEN 'Mortgage Mgmt 2'
-                WHEN Employee.JobCode IN ('11007') THEN 'Branch Management/Lead CUA OR VRC Upper Management'
-                WHEN Employee.JobCode IN ('83004') THEN 'MRC Manager'
-                WHEN Employee.JobCode IN ('86004','86006','86005') THEN 'Payment Solutions Supervisor'
-                WHEN Employee.JobCode IN ('86009','86008') THEN 'Payment Solutions Rep'
-                WHEN Employee.JobCode IN ('73005') THEN 'Branch District Management'
-                WHEN Employee.JobCode IN ('87020','87003','87006','87002','870010','87021') THEN 'Loss Mitigation Supervisor'
-                WHEN Employee.JobCode IN ('87017','87019') THEN 'Loss Mitigation Member Advocate/Rep'
-                WHEN Employee.JobCode IN ('87014','87011','87018') THEN 'Loss Mitigation - Specialized'
-                WHEN Employee.JobCode IN ('90008') THEN 'Strat-Mgmt'
-                WHEN Employee.JobCode IN ('89120','83030') THEN 'E-Services Rep'
-                WHEN Employee.JobCode IN ('83007','83011') THEN 'MRC I'
-                WHEN Employee.JobCode IN ('83008') THEN 'MRC II'
-                WHEN Employee.JobCode IN ('83006','83025') THEN 'MRC Supervisor'
-                WHEN Employee.JobCode IN ('85008','85041','85022','85006','85007','85012','85018','85019','85002','85032') THEN 'Mortgage Rep 3'
-                WHEN Employee.JobCode IN ('85020','85024','85013','85016','85017','85011','85036') THEN 'Mortgage Rep 2'
-                WHEN Employee.JobCode IN ('85010','85030') THEN 'Mortgage Rep 1'
-                WHEN Employee.JobCode IN ('85025') THEN 'Mortgage Mgmt 1'
-                WHEN Employee.JobCode IN ('79040') THEN 'Senior Lending Management'
-                WHEN Employee.JobCode IN ('117') THEN 'VRC Teller'
-                WHEN Employee.JobCode IN ('73009') THEN 'VRC Upper Management'
-                WHEN Employee.JobCode IN ('83010') THEN 'MRC Supervisor'
-                ELSE NULL
-            END AS [Keystone_Expected_Role_For_Job_Title]
+            Employee.[JobCode] AS UKG_Job_Code
         FROM
             [STAGING].[S1_KEY_USER] AS [User]
         LEFT JOIN
@@ -238,23 +387,43 @@ class EmployeeProfilesRefreshService(BaseConfigurableService):
                 connection_string, timeout=self.connection_timeout
             ) as conn:
                 cursor = conn.cursor()
+                cursor.arraysize = _FETCH_BATCH_SIZE
                 cursor.execute(query)
 
-                columns = [column[0] for column in cursor.description]
+                columns = tuple(column[0] for column in cursor.description)
+                # pyodbc reports the Python type of each column, so only the
+                # datetime columns need converting
+                datetime_columns = [
+                    i
+                    for i, column in enumerate(cursor.description)
+                    if column[1] is datetime
+                ]
 
-                results = []
-                for row in cursor.fetchall():
-                    row_dict = {}
-                    for i, value in enumerate(row):
-                        column_name = columns[i]
-                        if isinstance(value, datetime):
-                            row_dict[column_name] = value.isoformat()
-                        else:
-                            row_dict[column_name] = value
-                    results.append(row_dict)
+                count = 0
+                while True:
+                    rows = cursor.fetchmany()
+                    if not rows:
+                        break
+                    for row in rows:
+                        values = list(row)
+                        for i in datetime_columns:
+                            value = values[i]
+                            if value is not None:
+                                values[i] = value.isoformat()
+                        record = dict(zip(columns, values))
+                        # Resolved here rather than by a CASE in the query;
+                        # normalized like SQL Server's case- and trailing-space-
+                        # insensitive comparison
+                        job_code = record.get("UKG_Job_Code")
+                        record["Keystone_Expected_Role_For_Job_Title"] = (
+                            _EXPECTED_ROLE_BY_JOB_CODE.get(job_code.rstrip().upper())
+                            if job_code
+                            else None
+                        )
+                        count += 1
+                        yield record
 
-                logger.info(f"Retrieved {len(results)} records from data warehouse")
-                return results
+                logger.info(f"Retrieved {count} records from data warehouse")
 
         except pyodbc.Error as e:
             logger.error(f"ODBC error executing keystone query: {str(e)}")
@@ -265,22 +434,26 @@ class EmployeeProfilesRefreshService(BaseConfigurableService):
 
     # --- Employee profile loading ---
 
-    def load_keystone_employee_data(self) -> List[Dict[str, Any]]:
+    def load_keystone_employee_data(
+        self, fallback: bool = True
+    ) -> List[Dict[str, Any]]:
         """
         Load employee data from Azure SQL Server data warehouse.
 
+        Args:
+            fallback: Return mock data when the warehouse query fails; when
+                False the error is raised instead
+
         Returns:
             List of employee records from Azure SQL Server
         """
         logger.info("Loading employee data from Azure SQL Server")
 
         try:
-            # Execute the Keystone query directly against Azure SQL
-            raw_records = self.execute_keystone_query()
-
-            # Transform the data to match EmployeeProfiles model field names
+            # Stream the Keystone query results from Azure SQL and transform
+            # them to match EmployeeProfiles model field names as they arrive
             transformed_records = []
-            for record in raw_records:
+            for record in self.iter_keystone_records():
                 # Convert datetime strings back to datetime objects if needed
                 ks_last_login_time = record.get("KS_Last_Login_Time")
                 if isinstance(ks_last_login_time, str):
@@ -315,6 +488,8 @@ class EmployeeProfilesRefreshService(BaseConfigurableService):
 
         except Exception as e:
             logger.error(f"Error loading employee data from Azure SQL: {str(e)}")
+            if not fallback:
+                raise
             # Fall back to mock data for development/testing
             logger.warning("Falling back to mock data due to Azure SQL error")
             return self._get_fallback_mock_data()
@@ -557,12 +732,16 @@ class EmployeeProfilesRefreshService(BaseConfigurableService):
         service_name="employee_profiles_refresh",
         default_return={"success": 0, "failed": 0, "total": 0},
     )
-    def refresh_all_profiles(self) -> Dict[str, Any]:
+    def refresh_all_profiles(self, fallback: bool = True) -> Dict[str, Any]:
         """
         Refresh all employee profiles from Azure SQL and Graph API.
 
         This is the main entry point for the service.
 
+        Args:
+            fallback: Process mock data when the warehouse query fails; when
+                False the error is raised and nothing is written
+
         Returns:
             Dictionary with processing statistics
         """
@@ -571,7 +750,7 @@ class EmployeeProfilesRefreshService(BaseConfigurableService):
 
         try:
             # Step 1: Load employee data from Azure SQL
-            employee_records = self.load_keystone_employee_data()
+            employee_records = self.load_keystone_employee_data(fallback=fallback)
 
             if not employee_records:
                 logger.warning("No employee records found, nothing to process")
@@ -857,11 +1036,15 @@ class EmployeeProfilesRefreshService(BaseConfigurableService):
             Dictionary with refresh statistics: total_records, cached_records.
         """
         try:
-            results = self.execute_keystone_query()
-            refresh_stats = self.refresh_all_profiles()
+            # refresh_all_profiles runs the keystone query itself; without the
+            # mock fallback a warehouse failure raises before anything is written
+            refresh_stats = self.refresh_all_profiles(fallback=False)
             stored_count = refresh_stats.get("success", 0)
             logger.info(f"Cached {stored_count} data warehouse records")
-            return {"total_records": len(results), "cached_records": stored_count}
+            return {
+                "total_records": refresh_stats.get("total", 0),
+                "cached_records": stored_count,
+            }
         except Exception as e:
             logger.error(f"Error refreshing data warehouse cache: {str(e)}")
             raise
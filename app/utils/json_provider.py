@@ -0,0 +1,52 @@
+"""Flask JSON provider backed by orjson.
+
+Drop-in replacement for Flask's ``DefaultJSONProvider``: responses keep the
+same shape (sorted keys, compact output outside debug, RFC 822 dates via
+Flask's ``default`` hook) but are encoded by orjson, which is several times
+faster on the large audit-log listings. Calls that pass ``json.dumps``-only
+options, and values orjson cannot encode, fall back to the stdlib path.
+"""
+
+from typing import Any
+
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson  # type: ignore[import-not-found]
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+_COMPACT_SEPARATORS = (",", ":")
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """``DefaultJSONProvider`` that serializes with orjson when it can."""
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        indent = kwargs.get("indent")
+        separators = kwargs.get("separators")
+        extra = set(kwargs) - {"indent", "separators"}
+        if (
+            orjson is None
+            or extra
+            or indent not in (None, 2)
+            or separators not in (None, _COMPACT_SEPARATORS)
+        ):
+            return super().dumps(obj, **kwargs)
+
+        # Dates go through Flask's default hook so they keep the HTTP-date
+        # format API clients already parse.
+        option = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent == 2:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, default=self.default, option=option).decode()
+        except TypeError:
+            return super().dumps(obj, **kwargs)
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        if orjson is None or kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
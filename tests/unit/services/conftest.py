@@ -0,0 +1,48 @@
+"""Service unit-test fixtures: minimal concrete subclasses of the app/services/base.py classes.
+
+The fixtures return the class rather than an instance because most tests patch
+``config_get`` first and then construct the service with their own prefix.
+"""
+
+import pytest
+
+from app.services.base import BaseAPIService, BaseCacheService, BaseTokenService
+
+
+class DemoAPI(BaseAPIService):
+    def test_connection(self):
+        return True
+
+
+class DemoToken(BaseTokenService):
+    """Token service whose OAuth fetch always stores and returns ``"fresh"``."""
+
+    def test_connection(self):
+        return True
+
+    def _fetch_new_token(self):
+        self._store_token("fresh", 3600)
+        return "fresh"
+
+
+class DemoCache(BaseCacheService):
+    def refresh_cache(self):
+        return {}
+
+
+@pytest.fixture
+def demo_api_cls():
+    """Concrete BaseAPIService subclass."""
+    return DemoAPI
+
+
+@pytest.fixture
+def demo_token_cls():
+    """Concrete BaseTokenService subclass that fetches the token ``"fresh"``."""
+    return DemoToken
+
+
+@pytest.fixture
+def demo_cache_cls():
+    """Concrete BaseCacheService subclass with a no-op refresh."""
+    return DemoCache
@@ -0,0 +1,105 @@
+"""Unit tests for AuditPartitionService: partition naming/bounds, creation SQL and lifecycle."""
+
+from datetime import date
+
+import pytest
+
+from app.services.audit_partition_service import (
+    AuditPartitionService,
+    partition_bounds,
+)
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def session(mocker):
+    """Patch db.session; audit_log is partitioned, error_log is not."""
+    session = mocker.patch("app.database.db").session
+    session.stranded = False
+
+    def execute(stmt, params=None):
+        sql = str(stmt)
+        result = mocker.MagicMock()
+        if "pg_partitioned_table" in sql:
+            result.scalar.return_value = params["table"] == "audit_log"
+        elif "to_regclass" in sql:
+            result.scalar.return_value = False
+        elif "SELECT EXISTS (SELECT 1 FROM" in sql:
+            result.scalar.return_value = session.stranded
+        elif "information_schema.columns" in sql:
+            result.scalar.return_value = "id, created_at"
+        return result
+
+    session.execute.side_effect = execute
+    return session
+
+
+def _statements(session):
+    return [str(call.args[0]) for call in session.execute.call_args_list]
+
+
+def test_partition_bounds_cover_one_calendar_month():
+    assert partition_bounds("audit_log", date(2026, 10, 18)) == (
+        "audit_log_p2026_10",
+        date(2026, 10, 1),
+        date(2026, 11, 1),
+    )
+
+
+def test_partition_bounds_roll_over_year_end():
+    assert partition_bounds("error_log", date(2026, 12, 1)) == (
+        "error_log_p2026_12",
+        date(2026, 12, 1),
+        date(2027, 1, 1),
+    )
+
+
+def test_start_then_stop_state_machine(mocker):
+    svc = AuditPartitionService()
+    mocker.patch.object(svc, "_run", lambda: None)
+    svc.start()
+    assert svc.is_running is True
+    assert svc.thread is not None
+    svc.stop()
+    assert svc.is_running is False
+
+
+def test_ensure_partitions_locks_then_creates_if_not_exists(session):
+    created = AuditPartitionService().ensure_partitions(date(2026, 10, 18))
+
+    assert created == ["audit_log_p2026_10", "audit_log_p2026_11"]
+    statements = _statements(session)
+    assert "pg_advisory_xact_lock" in statements[0]
+    creates = [sql for sql in statements if sql.startswith("CREATE TABLE")]
+    assert creates == [
+        'CREATE TABLE IF NOT EXISTS "audit_log_p2026_10" PARTITION OF "audit_log" '
+        "FOR VALUES FROM ('2026-10-01') TO ('2026-11-01')",
+        'CREATE TABLE IF NOT EXISTS "audit_log_p2026_11" PARTITION OF "audit_log" '
+        "FOR VALUES FROM ('2026-11-01') TO ('2026-12-01')",
+    ]
+    session.commit.assert_called_once()
+
+
+def test_ensure_partitions_moves_rows_out_of_default_partition(session):
+    session.stranded = True
+
+    AuditPartitionService().ensure_partitions(date(2026, 10, 18))
+
+    statements = _statements(session)
+    move = next(sql for sql in statements if "DELETE FROM" in sql)
+    assert 'DELETE FROM "audit_log_default"' in move
+    assert 'INSERT INTO "audit_log_p2026_10" (id, created_at)' in move
+    assert (
+        'ALTER TABLE "audit_log" ATTACH PARTITION "audit_log_p2026_10" '
+        "FOR VALUES FROM ('2026-10-01') TO ('2026-11-01')"
+    ) in statements
+    assert not any("PARTITION OF" in sql for sql in statements)
+
+
+def test_ensure_partitions_rolls_back_on_error(session):
+    session.commit.side_effect = RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        AuditPartitionService().ensure_partitions(date(2026, 10, 18))
+    session.rollback.assert_called_once()
@@ -256,3 +256,133 @@ def test_get_errors_returns_list_within_window(audit_svc, app, db_session):
     audit_svc.log_error(error_type="t", error_message="m")
     errors = audit_svc.get_errors(days=7)
     assert isinstance(errors, list)
+
+
+# ----------------- get_event_types / get_users_with_activity caching ----------
+
+
+def test_users_with_activity_cached_until_new_user_logged(mocker):
+    svc = PostgresAuditService()
+    loader = mocker.patch.object(
+        svc, "_query_users_with_activity", return_value=["a@x.com"]
+    )
+    svc._known_users.add("a@x.com")
+
+    assert svc.get_users_with_activity() == ["a@x.com"]
+    assert svc.get_users_with_activity() == ["a@x.com"]
+    assert loader.call_count == 1
+
+    svc._note_user("a@x.com")  # already known: cache kept
+    svc.get_users_with_activity()
+    assert loader.call_count == 1
+
+    svc._note_user("new@x.com")  # first sighting: cache dropped
+    svc.get_users_with_activity()
+    assert loader.call_count == 2
+
+
+def test_event_types_lookup_failure_not_cached(mocker):
+    svc = PostgresAuditService()
+    loader = mocker.patch.object(
+        svc, "_query_event_types", side_effect=[RuntimeError("db down"), ["search"]]
+    )
+    assert svc.get_event_types() == []
+    assert svc.get_event_types() == ["search"]
+    assert loader.call_count == 2
+
+
+# ----------------- write failure handling -------------------------------------
+
+
+def test_failed_write_closes_session_when_rollback_fails(mocker):
+    svc = PostgresAuditService()
+    mocker.patch.object(AuditLog, "log_access", side_effect=RuntimeError("boom"))
+    db = mocker.patch("app.services.audit_service_postgres.db")
+    db.session.rollback.side_effect = RuntimeError("connection lost")
+
+    svc.log_access("user@x.com", "view", "/admin")  # must not raise
+
+    db.session.rollback.assert_called_once()
+    db.session.close.assert_called_once()
+
+
+# ----------------- query_logs statement cache ---------------------------------
+
+
+def test_query_logs_statement_reused_per_filter_shape():
+    from app.services.audit_service_postgres import (
+        _query_logs_shape_and_params,
+        _query_logs_statements,
+    )
+
+    shape_a, params_a = _query_logs_shape_and_params(
+        "search", "Alice", None, None, None, "10.%", None
+    )
+    shape_b, params_b = _query_logs_shape_and_params(
+        "access", "bob", None, None, None, "192.%", None
+    )
+    assert shape_a == shape_b
+    assert _query_logs_statements(shape_a) is _query_logs_statements(shape_b)
+    assert params_a["user_email"] == "%Alice%"
+    assert params_b["ip_address"] == "192.%"
+
+    shape_c, _ = _query_logs_shape_and_params(
+        "search", "Alice", None, None, None, "10.1", None
+    )
+    assert shape_c != shape_a  # contains vs prefix render different SQL
+
+
+def test_unfiltered_recent_logs_use_prebuilt_statement(mocker):
+    from app.services import audit_service_postgres as module
+
+    db = mocker.patch.object(module, "db")
+    db.session.execute.return_value = []
+
+    assert PostgresAuditService().get_recent_logs(limit=25) == []
+    db.session.execute.assert_called_once_with(module._RECENT_LOGS_STMT, {"limit": 25})
+
+
+def test_log_error_writes_both_rows_in_one_statement(mocker):
+    from sqlalchemy.dialects import postgresql
+
+    from app.services import audit_service_postgres as module
+
+    db = mocker.patch.object(module, "db")
+    PostgresAuditService().log_error("ValueError", "bad input", user_email="u@x.com")
+
+    db.session.execute.assert_called_once()
+    db.session.commit.assert_called_once()
+    sql = str(
+        db.session.execute.call_args.args[0].compile(dialect=postgresql.dialect())
+    )
+    assert "INSERT INTO audit_log" in sql and "INSERT INTO error_log" in sql
+
+
+def test_audit_row_serialized_positionally():
+    from datetime import datetime
+
+    from app.services.audit_service_postgres import _AUDIT_KEYS, _audit_dict
+
+    values = {key: None for key in _AUDIT_KEYS}
+    values.update(
+        event_type="search",
+        created_at=datetime(2026, 1, 2, 3, 4, 5),
+        search_services='["ldap"]',
+    )
+    data = _audit_dict(tuple(values[key] for key in _AUDIT_KEYS) + (7,))
+    assert data["event_type"] == "search"
+    assert data["timestamp"] == data["created_at"] == "2026-01-02T03:04:05"
+    assert data["search_services"] == ["ldap"]
+    assert "total" not in data
+
+
+def test_now_cached_for_the_request_only():
+    from flask import Flask
+
+    from app.services.audit_service_postgres import _now_cached
+
+    with Flask(__name__).test_request_context():
+        first = _now_cached()
+        assert first.tzinfo is not None
+        assert _now_cached() is first
+    assert _now_cached() is not first
@@ -0,0 +1,128 @@
+"""Unit tests for AuditWriter: COPY serialization, sink install/restore, back-pressure."""
+
+import json
+from datetime import datetime, timezone
+
+import pytest
+from flask import Flask
+
+from app.database import RawJSON, json_serializer
+from app.models.audit import AuditLog
+from app.services.audit_writer import (
+    AUDIT_COPY_COLUMNS,
+    AuditWriter,
+    build_copy_buffer,
+)
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def writer(mocker):
+    svc = AuditWriter(app=Flask(__name__), max_queue_size=2)
+    mocker.patch.object(svc, "_run", lambda: None)
+    yield svc
+    svc.stop()
+
+
+def test_enqueue_rejected_when_stopped():
+    svc = AuditWriter()
+    assert svc.enqueue({"event_type": "search"}) is False
+
+
+def test_start_installs_row_sink_and_stop_restores(writer):
+    writer.start()
+    assert AuditLog._row_sink == writer.enqueue
+    writer.stop()
+    assert AuditLog._row_sink is None
+    assert writer.is_running is False
+
+
+def test_log_event_queues_row_while_running(writer):
+    writer.start()
+    result = AuditLog.log_access("user@x.com", "view", "/admin")
+    assert result is None
+    row = writer._queue.get_nowait()
+    assert row["event_type"] == "access"
+    assert row["target_resource"] == "/admin"
+    assert row["created_at"] is not None
+
+
+def test_start_without_app_raises():
+    svc = AuditWriter()
+    with pytest.raises(RuntimeError, match="no Flask app"):
+        svc.start()
+    assert svc.is_running is False
+    assert AuditLog._row_sink is None
+
+
+def test_failed_flush_writes_rows_individually(writer, mocker):
+    from app.models import audit as audit_module
+
+    flush = mocker.patch.object(writer, "_flush", side_effect=RuntimeError("boom"))
+    mocker.patch("app.services.audit_writer.time.sleep")
+    db = mocker.patch.object(audit_module, "db")
+    rows = [AuditLog.build_row("access", f"u{i}@x.com", "view", {}) for i in range(3)]
+
+    writer._write_batch(rows)
+
+    assert flush.call_count == AuditWriter.FLUSH_ATTEMPTS
+    written = [call.args[1][0] for call in db.session.execute.call_args_list]
+    assert written == rows
+    assert db.session.commit.call_count == 3
+
+
+def test_enqueue_returns_false_when_queue_full(writer):
+    writer.start()
+    assert writer.enqueue({"n": 1}) is True
+    assert writer.enqueue({"n": 2}) is True
+    assert writer.enqueue({"n": 3}) is False
+
+
+def test_copy_buffer_escapes_and_nulls():
+    ts = datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+    buffer = build_copy_buffer(
+        [
+            {
+                "event_type": "error",
+                "user_email": "user@x.com",
+                "action": "Boom",
+                "success": False,
+                "message": "line1\nline2\twith\\slash",
+                "additional_data": {"k": "v"},
+                "created_at": ts,
+                "updated_at": ts,
+            }
+        ]
+    )
+    line = buffer.getvalue()
+    assert line.endswith("\n")
+    fields = line[:-1].split("\t")
+    assert len(fields) == len(AUDIT_COPY_COLUMNS)
+    values = dict(zip(AUDIT_COPY_COLUMNS, fields))
+    assert values["success"] == "f"
+    assert values["message"] == "line1\\nline2\\twith\\\\slash"
+    assert values["additional_data"] == '{"k": "v"}'
+    assert values["target_resource"] == "\\N"
+    assert values["created_at"] == ts.isoformat()
+
+
+def test_pre_serialized_json_passes_through_unchanged():
+    raw = RawJSON('{"error_type":"Boom"}')
+    assert json_serializer(raw) is raw
+    assert json.loads(json_serializer({"k": "v", 1: None})) == {"k": "v", "1": None}
+    fields = build_copy_buffer([{"additional_data": raw}]).getvalue()[:-1].split("\t")
+    assert dict(zip(AUDIT_COPY_COLUMNS, fields))["additional_data"] == raw
+
+
+def test_log_event_inserts_directly_when_writer_stopped(mocker):
+    from app.models import audit as audit_module
+
+    db = mocker.patch.object(audit_module, "db")
+    db.session.execute.return_value.scalar_one.return_value = 42
+
+    assert AuditLog.log_access("user@x.com", "view", "/admin") == 42
+    (stmt, rows), _ = db.session.execute.call_args
+    assert rows[0]["target_resource"] == "/admin"
+    db.session.add.assert_not_called()
+    db.session.commit.assert_called_once()
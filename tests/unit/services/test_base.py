@@ -0,0 +1,273 @@
+"""Unit tests for the shared service base classes in app/services/base.py."""
+
+import pytest
+
+from app.services import base
+from app.services.base import BaseConfigurableService
+
+pytestmark = pytest.mark.unit
+
+
+def test_get_config_caches_none_without_refetching(mocker):
+    config_get = mocker.patch.object(base, "config_get", return_value=None)
+    svc = BaseConfigurableService("demo")
+
+    assert svc._get_config("missing") is None
+    assert svc._get_config("missing") is None
+    config_get.assert_called_once_with("demo.missing", base._MISSING)
+
+
+def test_get_config_reuses_joined_key(mocker):
+    mocker.patch.object(base, "config_get", side_effect=lambda key, default: key)
+    svc = BaseConfigurableService("demo")
+
+    first = svc._get_config("api_timeout")
+    svc._clear_config_cache()
+    assert svc._get_config("api_timeout") is first
+    assert svc._key_cache == {"api_timeout": "demo.api_timeout"}
+
+
+def test_timeout_cached_until_config_cleared(mocker, demo_api_cls):
+    config_get = mocker.patch.object(base, "config_get", return_value="20")
+    svc = demo_api_cls("demo")
+
+    assert svc.timeout == 20
+    assert svc.timeout == 20
+    timeout_reads = [
+        c for c in config_get.call_args_list if c.args[0] == "demo.api_timeout"
+    ]
+    assert len(timeout_reads) == 1
+
+    config_get.return_value = "45"
+    svc._clear_config_cache()
+    assert svc.timeout == 45
+
+
+def test_requests_reuse_one_pooled_session(mocker, demo_api_cls):
+    mocker.patch.object(base, "config_get", side_effect=lambda key, default: default)
+    request = mocker.patch.object(base.requests.Session, "request")
+    request.return_value.status_code = 200
+    svc = demo_api_cls("demo")
+
+    svc._make_request("GET", "https://example.test/a")
+    svc._make_request("GET", "https://example.test/b")
+
+    assert request.call_count == 2
+    adapter = svc._session.get_adapter("https://example.test")
+    assert adapter._pool_maxsize == 20
+    assert adapter.max_retries.status_forcelist == (502, 503, 504)
+    assert (adapter.max_retries.connect, adapter.max_retries.read) == (3, 0)
+    assert svc._session.get_adapter("http://example.test") is adapter
+    assert svc._session.headers["Accept"] == "application/json"
+    assert svc._session.headers["User-Agent"] == "WhoDis-Service/demo"
+
+
+def test_only_authorization_header_sent_per_request(mocker, demo_api_cls):
+    mocker.patch.object(base, "config_get", side_effect=lambda key, default: default)
+    request = mocker.patch.object(base.requests.Session, "request")
+    request.return_value.status_code = 200
+    svc = demo_api_cls("demo")
+
+    svc._make_request("GET", "https://example.test/a", token="abc")
+    svc._make_request("GET", "https://example.test/b")
+
+    assert request.call_args_list[0].kwargs["headers"] == {
+        "Authorization": "Bearer abc"
+    }
+    assert "headers" not in request.call_args_list[1].kwargs
+
+
+def test_fresh_in_memory_token_skips_cache_repository(mocker, demo_token_cls):
+    repo = mocker.MagicMock()
+    repo.get_token.return_value = None
+    svc = demo_token_cls("demo", "demo", cache_repository=repo)
+
+    assert svc.get_access_token() == "fresh"
+    assert svc.get_access_token() == "fresh"
+    repo.get_token.assert_called_once_with("demo")
+
+    # Inside the expiry buffer the shared cache is consulted again
+    svc._mem_token_exp = base.time.monotonic() + 30
+    repo.get_token.return_value = "shared"
+    assert svc.get_access_token() == "shared"
+
+
+def test_concurrent_token_misses_fetch_once(mocker, demo_token_cls):
+    import threading
+
+    release = threading.Event()
+    fetch = demo_token_cls._fetch_new_token
+
+    def slow_fetch(self):
+        release.wait(timeout=2)
+        return fetch(self)
+
+    fetches = mocker.patch.object(
+        demo_token_cls, "_fetch_new_token", autospec=True, side_effect=slow_fetch
+    )
+    repo = mocker.MagicMock()
+    repo.get_token.return_value = None
+    svc = demo_token_cls("demo", "demo", cache_repository=repo)
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(svc.get_access_token()))
+        for _ in range(4)
+    ]
+    for t in threads:
+        t.start()
+    release.set()
+    for t in threads:
+        t.join(timeout=5)
+
+    assert results == ["fresh"] * 4
+    assert fetches.call_count == 1
+
+
+def test_normalize_search_term_adds_username_once():
+    from app.services.base import BaseSearchService
+
+    normalize = BaseSearchService._normalize_search_term
+
+    assert normalize(None, "jdoe@example.com") == ["jdoe@example.com", "jdoe"]
+    assert normalize(None, "a@b@c") == ["a@b@c", "a"]
+    assert normalize(None, "jdoe") == ["jdoe"]
+    assert normalize(None, "  jdoe@example.com ") == ["jdoe@example.com", "jdoe"]
+    assert normalize(None, "@example.com") == ["@example.com"]
+
+
+def test_needs_refresh_compares_against_refresh_period(mocker, demo_cache_cls):
+    from datetime import datetime, timedelta, timezone
+
+    mocker.patch.object(base, "config_get", return_value="3600")
+    svc = demo_cache_cls("demo")
+    now = datetime.now(timezone.utc)
+
+    assert svc.needs_refresh(now - timedelta(minutes=5)) is False
+    assert svc.needs_refresh(now - timedelta(hours=2)) is True
+    # Naive timestamps are UTC, not local time
+    assert svc.needs_refresh((now - timedelta(minutes=5)).replace(tzinfo=None)) is False
+    assert svc.needs_refresh_epoch(now.timestamp() - 7200) is True
+
+
+def test_handle_response_parses_body_and_skips_empty(mocker, demo_api_cls):
+    svc = demo_api_cls("demo")
+    response = mocker.MagicMock(status_code=200, content=b'{"value": [1, 2]}')
+    assert svc._handle_response(response) == {"value": [1, 2]}
+
+    response.content = b""
+    assert svc._handle_response(response) is None
+    response.json.assert_not_called()
+
+
+def test_success_status_skips_raise_for_status(mocker, demo_api_cls):
+    mocker.patch.object(base, "config_get", side_effect=lambda key, default: default)
+    response = mocker.MagicMock(status_code=201, content=b'{"id": "x"}')
+    mocker.patch.object(base.requests.Session, "request", return_value=response)
+    svc = demo_api_cls("demo")
+
+    result = svc._make_request("POST", "https://example.test/items")
+
+    response.raise_for_status.assert_not_called()
+    assert svc._handle_response(result) == {"id": "x"}
+
+
+def test_timeout_error_names_the_service(mocker, demo_api_cls):
+    mocker.patch.object(base, "config_get", side_effect=lambda key, default: default)
+    mocker.patch.object(
+        base.requests.Session, "request", side_effect=base.Timeout("slow")
+    )
+    svc = demo_api_cls("genesys")
+
+    with pytest.raises(TimeoutError, match="Genesys request timed out after 15"):
+        svc._make_request("GET", "https://example.test/a")
+
+
+def test_base_attributes_live_in_slots():
+    svc = BaseConfigurableService("demo")
+
+    assert not hasattr(svc, "__dict__")
+    svc._clear_config_cache()
+
+
+def test_format_multiple_results_keeps_explicit_zero_total():
+    from app.services.base import BaseSearchService
+
+    payload = BaseSearchService._format_multiple_results(None, [{"id": 1}], 0)
+
+    assert payload == {"multiple_results": True, "results": [{"id": 1}], "total": 0}
+    assert base._format_multiple_results([{"id": 1}])["total"] == 1
+
+
+def test_token_row_from_repository_is_remembered_until_expiry(mocker, demo_token_cls):
+    from datetime import datetime, timedelta, timezone
+
+    from app.repositories.cache_repository import CacheRepository
+
+    assert isinstance(demo_token_cls("demo", "demo")._cache_repository, CacheRepository)
+
+    row = mocker.MagicMock(
+        access_token="stored",
+        expires_at=datetime.now(timezone.utc) + timedelta(hours=1),
+    )
+    repo = mocker.MagicMock()
+    repo.get_token.return_value = row
+    svc = demo_token_cls("demo", "demo", cache_repository=repo)
+
+    assert svc.get_access_token() == "stored"
+    assert svc.get_access_token() == "stored"
+    repo.get_token.assert_called_once_with("demo")
+
+
+def test_unauthorized_response_invalidates_in_memory_token(mocker, demo_token_cls):
+    import requests
+
+    mocker.patch.object(base, "config_get", side_effect=lambda key, default: default)
+    response = mocker.MagicMock(status_code=401)
+    response.raise_for_status.side_effect = requests.HTTPError(response=response)
+    mocker.patch.object(base.requests.Session, "request", return_value=response)
+    # The saved token row has not expired, so the cache still hands it back
+    repo = mocker.MagicMock()
+    repo.get_token.return_value = "revoked"
+    svc = demo_token_cls("demo", "demo", cache_repository=repo)
+    svc._remember_token("revoked", 3600)
+
+    with pytest.raises(requests.HTTPError):
+        svc._make_request("GET", "https://example.test/a", token="revoked")
+
+    assert svc._fresh_mem_token() is None
+    assert svc.get_access_token() == "fresh"
+
+
+def test_error_body_logged_truncated(mocker):
+    response = mocker.MagicMock(content=b"x" * 2000)
+
+    assert base._body_preview(response) == "x" * 512
+
+
+def test_bulk_upsert_issues_one_statement(mocker, demo_cache_cls):
+    from sqlalchemy.dialects import postgresql
+
+    from app.models.external_service import ExternalServiceData
+
+    session = mocker.patch.object(base.db, "session")
+    svc = demo_cache_cls("demo")
+    rows = [
+        {"service_name": "genesys", "data_type": "group", "service_id": sid}
+        for sid in ("g1", "g2")
+    ]
+
+    written = svc._bulk_upsert(
+        ExternalServiceData.__table__,
+        rows,
+        conflict_cols=["service_name", "data_type", "service_id"],
+        update_cols=["name", "updated_at"],
+    )
+
+    assert written == 2
+    (stmt,), _ = session.execute.call_args
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+    assert sql.count("INSERT INTO external_service_data") == 1
+    assert "ON CONFLICT (service_name, data_type, service_id) DO UPDATE" in sql
+    session.commit.assert_called_once()
+    assert svc._bulk_upsert(ExternalServiceData.__table__, [], [], []) == 0
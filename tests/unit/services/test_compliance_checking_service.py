@@ -225,6 +225,30 @@ def test_run_compliance_check_creates_run_row(svc, db_session):
     assert persisted.completed_at is not None
 
 
+def test_run_compliance_check_bulk_inserts_checks(svc, db_session):
+    jc = JobCodeFactory(job_code="ENG-RUN")
+    sr = SystemRoleFactory(
+        role_name="Admin", system_name="ad_groups", role_type="security_group"
+    )
+    JobRoleMappingFactory(
+        job_code=jc, system_role=sr, mapping_type="required", priority=3
+    )
+    db.session.commit()
+    _seed_employee("carol@test.local", "ENG-RUN")
+    EmployeeRoleAssignment(
+        employee_upn="carol@test.local", system_name="ad_groups", role_name="Rogue"
+    ).save()
+
+    run = svc.run_compliance_check(scope="job_code", scope_filter="ENG-RUN")
+
+    assert run.total_checks == 2
+    statuses = {
+        c.compliance_status
+        for c in ComplianceCheck.query.filter_by(check_run_id=run.run_id)
+    }
+    assert statuses == {"missing_required", "unexpected_role"}
+
+
 def test_get_compliance_summary_with_run_id(svc, db_session):
     # Seed a completed run with 2 checks
     run = ComplianceCheckRun(
@@ -261,6 +285,8 @@ def test_get_compliance_summary_with_run_id(svc, db_session):
     assert summary["summary"]["compliant_checks"] == 1
     assert summary["summary"]["violation_checks"] == 1
     assert summary["violations"]["by_type"]["missing_required"] == 1
+    assert summary["violations"]["by_severity"] == {"high": 1}
+    assert summary["violations"]["by_system"] == {"ad_groups": 1}
 
 
 def test_get_compliance_summary_unknown_run_id_raises(svc, db_session):
@@ -1,11 +1,13 @@
 """Targeted unit tests for GenesysCloudService (D-12).
 
-Mocks app.services.base.requests.request at the BaseAPIService HTTP boundary
+Mocks app.services.base.requests.Session.request at the BaseAPIService HTTP boundary
 so no real Genesys traffic is generated. Covers service_name/token_service_name
 properties, search_user happy/empty paths, token refresh paths, and
 ApiToken-row round-trip on token fetch.
 """
 
+import json
+
 import pytest
 
 from app.services.genesys_service import GenesysCloudService
@@ -38,6 +40,7 @@ def _mock_response(mocker, json_data, status_code=200):
     response = mocker.MagicMock()
     response.status_code = status_code
     response.json.return_value = json_data
+    response.content = json.dumps(json_data).encode()
     response.raise_for_status = mocker.MagicMock()
     return response
 
@@ -66,7 +69,9 @@ def test_search_user_happy_path(mocker, db_session, app):
         },
     )
 
-    mocker.patch("app.services.base.requests.request", return_value=search_response)
+    mocker.patch(
+        "app.services.base.requests.Session.request", return_value=search_response
+    )
 
     result = svc.search_user("jdoe")
     assert result is not None
@@ -78,7 +83,7 @@ def test_search_user_no_results(mocker, db_session, app):
     svc = _make_genesys_service()
     mocker.patch.object(svc, "get_access_token", return_value="cached-token")
     mocker.patch(
-        "app.services.base.requests.request",
+        "app.services.base.requests.Session.request",
         return_value=_mock_response(mocker, {"results": []}),
     )
 
@@ -98,7 +103,9 @@ def test_refresh_token_when_expired_writes_apitoken_row(mocker, db_session, app)
     token_response = _mock_response(
         mocker, {"access_token": "new-token", "expires_in": 3600}
     )
-    mocker.patch("app.services.base.requests.request", return_value=token_response)
+    mocker.patch(
+        "app.services.base.requests.Session.request", return_value=token_response
+    )
 
     ok = svc.refresh_token_if_needed()
     assert ok is True
@@ -121,7 +128,7 @@ def test_refresh_token_when_valid_uses_cached_path(mocker, db_session, app):
 
     svc = _make_genesys_service()
 
-    http_mock = mocker.patch("app.services.base.requests.request")
+    http_mock = mocker.patch("app.services.base.requests.Session.request")
     ok = svc.refresh_token_if_needed()
     assert ok is True
     assert http_mock.call_count == 0
@@ -136,7 +143,9 @@ def test_token_storage_round_trip(mocker, db_session, app):
     token_response = _mock_response(
         mocker, {"access_token": "fresh-tok", "expires_in": 1800}
     )
-    mocker.patch("app.services.base.requests.request", return_value=token_response)
+    mocker.patch(
+        "app.services.base.requests.Session.request", return_value=token_response
+    )
 
     fetched = svc._fetch_new_token()
     assert fetched == "fresh-tok"
@@ -3,6 +3,8 @@
 Mocks requests at the base service boundary for HTTP mocking.
 """
 
+import json
+
 import pytest
 from requests import HTTPError
 
@@ -34,7 +36,9 @@ def _mock_response(mocker, status_code=200, json_data=None, content=b""):
     resp = mocker.MagicMock()
     resp.status_code = status_code
     resp.json.return_value = json_data or {}
-    resp.content = content
+    resp.content = (
+        content if content or json_data is None else json.dumps(json_data).encode()
+    )
     resp.raise_for_status = mocker.MagicMock()
     if status_code >= 400:
         http_err = HTTPError(response=resp)
@@ -49,7 +53,7 @@ class TestAssignLicense:
         svc.app.acquire_token_silent.return_value = {"access_token": "tok123", "expires_in": 3600}
 
         resp = _mock_response(mocker, status_code=200, json_data={})
-        mocker.patch("app.services.base.requests.request", return_value=resp)
+        mocker.patch("app.services.base.requests.Session.request", return_value=resp)
 
         result = svc.assign_license("user-id-123", "sku-abc-def")
         assert result["success"] is True
@@ -59,7 +63,7 @@ class TestAssignLicense:
         svc.app.acquire_token_silent.return_value = {"access_token": "tok123", "expires_in": 3600}
 
         resp = _mock_response(mocker, status_code=403)
-        mocker.patch("app.services.base.requests.request", return_value=resp)
+        mocker.patch("app.services.base.requests.Session.request", return_value=resp)
 
         result = svc.assign_license("user-id-123", "sku-abc-def")
         assert result["error"] == "permission_missing"
@@ -72,7 +76,7 @@ class TestRemoveLicense:
         svc.app.acquire_token_silent.return_value = {"access_token": "tok123", "expires_in": 3600}
 
         resp = _mock_response(mocker, status_code=200, json_data={})
-        mocker.patch("app.services.base.requests.request", return_value=resp)
+        mocker.patch("app.services.base.requests.Session.request", return_value=resp)
 
         result = svc.remove_license("user-id-123", "sku-abc-def")
         assert result["success"] is True
@@ -85,7 +89,7 @@ class TestSwapLicense:
         svc.app.acquire_token_silent.return_value = {"access_token": "tok123", "expires_in": 3600}
 
         resp = _mock_response(mocker, status_code=200, json_data={})
-        mocker.patch("app.services.base.requests.request", return_value=resp)
+        mocker.patch("app.services.base.requests.Session.request", return_value=resp)
 
         result = svc.swap_license("user-id-123", "old-sku", "new-sku")
         assert result["success"] is True
@@ -100,7 +104,7 @@ class TestSwapLicense:
         resp_success = _mock_response(mocker, status_code=200, json_data={})
 
         mock_request = mocker.patch(
-            "app.services.base.requests.request",
+            "app.services.base.requests.Session.request",
             side_effect=[resp_fail, resp_success, resp_success],
         )
 
@@ -119,7 +123,7 @@ class TestSwapLicense:
         resp_rollback_ok = _mock_response(mocker, status_code=200, json_data={})
 
         mocker.patch(
-            "app.services.base.requests.request",
+            "app.services.base.requests.Session.request",
             side_effect=[resp_fail_atomic, resp_remove_ok, resp_assign_fail, resp_rollback_ok],
         )
 
@@ -139,7 +143,7 @@ class TestSwapLicense:
         resp_rollback_fail = _mock_response(mocker, status_code=500)
 
         mocker.patch(
-            "app.services.base.requests.request",
+            "app.services.base.requests.Session.request",
             side_effect=[resp_fail_atomic, resp_remove_ok, resp_assign_fail, resp_rollback_fail],
         )
 
@@ -6,14 +6,15 @@ so that the 191 missed statements (msal flow, requests plumbing, error
 handling) are covered.
 
 GraphService inherits BaseAPIService whose _make_request() calls
-requests.request via app/services/base.py. We patch
-``app.services.base.requests.request`` for HTTP mocking — the same
+requests.Session.request via app/services/base.py. We patch
+``app.services.base.requests.Session.request`` for HTTP mocking — the same
 boundary GenesysCloudService tests use. msal is imported at the
 graph_service module top as ``ConfidentialClientApplication``; we
 patch it at ``app.services.graph_service.ConfidentialClientApplication``.
 """
 
 import base64
+import json
 
 import pytest
 
@@ -50,7 +51,9 @@ def _mock_response(mocker, status_code=200, json_data=None, content=b""):
     resp = mocker.MagicMock()
     resp.status_code = status_code
     resp.json.return_value = json_data or {}
-    resp.content = content
+    resp.content = (
+        content if content or json_data is None else json.dumps(json_data).encode()
+    )
     resp.raise_for_status = mocker.MagicMock()
     if status_code >= 400:
         from requests import HTTPError
@@ -99,7 +102,7 @@ def test_search_user_happy_path_email_lookup(mocker, app):
         "businessPhones": [],
     }
     mocker.patch(
-        "app.services.base.requests.request",
+        "app.services.base.requests.Session.request",
         return_value=_mock_response(mocker, 200, json_data=user_payload),
     )
     # Skip photo fetching to avoid extra HTTP cycles
@@ -130,7 +133,7 @@ def test_search_user_multiple_results_returned_via_filter(mocker, app):
         ]
     }
     mocker.patch(
-        "app.services.base.requests.request",
+        "app.services.base.requests.Session.request",
         return_value=_mock_response(mocker, 200, json_data=list_payload),
     )
     out = svc.search_user("jdoe", include_photo=False)
@@ -144,7 +147,7 @@ def test_search_user_no_matches_returns_none(mocker, app):
     svc = _make_graph_service(mocker)
     mocker.patch.object(svc, "get_access_token", return_value="cached")
     mocker.patch(
-        "app.services.base.requests.request",
+        "app.services.base.requests.Session.request",
         return_value=_mock_response(mocker, 200, json_data={"value": []}),
     )
     assert svc.search_user("ghost", include_photo=False) is None
@@ -163,7 +166,7 @@ def test_search_user_propagates_timeout_error(mocker, app):
     svc = _make_graph_service(mocker)
     mocker.patch.object(svc, "get_access_token", return_value="cached")
     mocker.patch(
-        "app.services.base.requests.request",
+        "app.services.base.requests.Session.request",
         side_effect=requests.exceptions.Timeout("graph timeout"),
     )
     with pytest.raises(TimeoutError):
@@ -225,7 +228,7 @@ def test_get_user_photo_returns_base64_data_url(mocker, app):
     # MIME type the implementation hardcodes (per Gemini PR #27 review).
     raw = b"\xff\xd8\xff\xe0\x00\x10JFIF-fake-photo-bytes"
     mocker.patch(
-        "app.services.base.requests.request",
+        "app.services.base.requests.Session.request",
         return_value=_mock_response(mocker, 200, content=raw),
     )
     out = svc.get_user_photo("g1")
@@ -289,7 +292,7 @@ def test_test_connection_happy_path(mocker, app, db_session):
         "expires_in": 3600,
     }
     mocker.patch(
-        "app.services.base.requests.request",
+        "app.services.base.requests.Session.request",
         return_value=_mock_response(mocker, 200, json_data={"value": []}),
     )
     assert svc.test_connection() is True
@@ -322,7 +325,7 @@ def test_get_sign_in_logs_happy_path(mocker, app):
         ]
     }
     mocker.patch(
-        "app.services.base.requests.request",
+        "app.services.base.requests.Session.request",
         return_value=_mock_response(mocker, 200, json_data=payload),
     )
     logs = svc.get_sign_in_logs("g1")
@@ -336,7 +339,7 @@ def test_get_sign_in_logs_empty_response_returns_empty_list(mocker, app):
     svc = _make_graph_service(mocker)
     mocker.patch.object(svc, "get_access_token", return_value="cached")
     mocker.patch(
-        "app.services.base.requests.request",
+        "app.services.base.requests.Session.request",
         return_value=_mock_response(mocker, 200, json_data={"value": []}),
     )
     assert svc.get_sign_in_logs("g1") == []
@@ -345,5 +348,5 @@ def test_get_sign_in_logs_empty_response_returns_empty_list(mocker, app):
 # Patch boundaries used in this file:
 #   - app.services.graph_service.ConfidentialClientApplication (msal seam,
 #     patched in _make_graph_service)
-#   - app.services.base.requests.request (the HTTP boundary BaseAPIService
+#   - app.services.base.requests.Session.request (the HTTP boundary BaseAPIService
 #     uses; graph_service does not import requests directly)
@@ -56,6 +56,16 @@ def test_get_connection_string_includes_server_and_database(configured_svc):
     assert "fake-client" in cs
 
 
+def test_connection_string_is_built_once_per_config_load(configured_svc):
+    first = configured_svc._get_connection_string()
+    configured_svc._config_cache["data_warehouse.server"] = "other.example.com"
+    assert configured_svc._get_connection_string() is first
+
+    configured_svc._clear_config_cache()
+    configured_svc._config_cache["data_warehouse.server"] = "other.example.com"
+    assert "other.example.com" in configured_svc._get_connection_string()
+
+
 # --- pyodbc-unavailable degradation ------------------------------------------
 
 
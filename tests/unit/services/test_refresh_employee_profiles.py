@@ -100,8 +100,72 @@ def test_test_connection_happy_path_with_mocked_connect(svc, mocker):
     assert svc.test_connection() is True
 
 
+def test_execute_keystone_query_fetches_in_batches_and_resolves_columns(svc, mocker):
+    from datetime import datetime
+
+    login = datetime(2026, 1, 2, 3, 4, 5)
+    cursor = mocker.MagicMock()
+    cursor.description = [
+        ("UPN", str),
+        ("KS_Last_Login_Time", datetime),
+        ("UKG_Job_Code", str),
+    ]
+    cursor.fetchmany.side_effect = [
+        [("a@test.local", login, "11007 "), ("b@test.local", None, None)],
+        [],
+    ]
+    conn = mocker.MagicMock()
+    conn.cursor.return_value = cursor
+    conn.__enter__.return_value = conn
+    fake_pyodbc = mocker.patch("app.services.refresh_employee_profiles.pyodbc")
+    fake_pyodbc.Error = type("Error", (Exception,), {})
+    fake_pyodbc.connect.return_value = conn
+
+    rows = svc.execute_keystone_query()
+
+    assert rows == [
+        {
+            "UPN": "a@test.local",
+            "KS_Last_Login_Time": login.isoformat(),
+            "UKG_Job_Code": "11007 ",
+            # 11007 is listed twice in the mapping; the first role wins
+            "Keystone_Expected_Role_For_Job_Title": "Branch Management/Lead CUA",
+        },
+        {
+            "UPN": "b@test.local",
+            "KS_Last_Login_Time": None,
+            "UKG_Job_Code": None,
+            "Keystone_Expected_Role_For_Job_Title": None,
+        },
+    ]
+    assert cursor.arraysize == ref_mod._FETCH_BATCH_SIZE
+    cursor.fetchall.assert_not_called()
+
+
+def test_iter_keystone_records_yields_before_fetching_the_next_batch(svc, mocker):
+    cursor = mocker.MagicMock()
+    cursor.description = [("UPN", str), ("UKG_Job_Code", str)]
+    cursor.fetchmany.side_effect = [
+        [("a@test.local", None)],
+        [("b@test.local", None)],
+        [],
+    ]
+    conn = mocker.MagicMock()
+    conn.cursor.return_value = cursor
+    conn.__enter__.return_value = conn
+    fake_pyodbc = mocker.patch("app.services.refresh_employee_profiles.pyodbc")
+    fake_pyodbc.Error = type("Error", (Exception,), {})
+    fake_pyodbc.connect.return_value = conn
+
+    records = svc.iter_keystone_records()
+    assert next(records)["UPN"] == "a@test.local"
+    assert cursor.fetchmany.call_count == 1
+    assert [r["UPN"] for r in records] == ["b@test.local"]
+    assert cursor.fetchmany.call_count == 3
+
+
 def test_load_keystone_employee_data_falls_back_on_query_error(svc, mocker):
-    mocker.patch.object(svc, "execute_keystone_query", side_effect=Exception("boom"))
+    mocker.patch.object(svc, "iter_keystone_records", side_effect=Exception("boom"))
     rows = svc.load_keystone_employee_data()
     assert isinstance(rows, list)
     assert len(rows) >= 1  # mock fallback data
@@ -120,13 +184,28 @@ def test_load_keystone_employee_data_transforms_query_results(svc, mocker):
             "Keystone_Expected_Role_For_Job_Title": "Admin",
         }
     ]
-    mocker.patch.object(svc, "execute_keystone_query", return_value=raw)
+    mocker.patch.object(svc, "iter_keystone_records", return_value=iter(raw))
     rows = svc.load_keystone_employee_data()
     assert len(rows) == 1
     assert rows[0]["upn"] == "alice@test.local"
     assert rows[0]["ukg_job_code"] == "ENG"
 
 
+def test_refresh_cache_raises_on_warehouse_error_without_writing(svc, mocker):
+    mocker.patch.object(
+        svc, "iter_keystone_records", side_effect=RuntimeError("warehouse down")
+    )
+    process_async = mocker.patch.object(svc, "_refresh_profiles_async")
+    process_sync = mocker.patch.object(svc, "_refresh_profiles_sync")
+
+    with pytest.raises(RuntimeError, match="warehouse down"):
+        svc.refresh_cache()
+
+    process_async.assert_not_called()
+    process_sync.assert_not_called()
+    assert EmployeeProfiles.query.filter_by(upn="john.doe@company.com").first() is None
+
+
 # --- DB-backed read paths -----------------------------------------------------
 
 
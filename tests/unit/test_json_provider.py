@@ -0,0 +1,38 @@
+"""Unit tests for the orjson-backed Flask JSON provider."""
+
+import json
+from datetime import datetime, timezone
+
+import pytest
+from flask import Flask
+
+from app.utils.json_provider import OrjsonProvider, orjson
+
+pytestmark = [
+    pytest.mark.unit,
+    pytest.mark.skipif(orjson is None, reason="orjson not installed"),
+]
+
+
+@pytest.fixture
+def json_app():
+    app = Flask(__name__)
+    app.json = OrjsonProvider(app)
+    return app
+
+
+def test_response_matches_default_provider_output(json_app):
+    payload = {"b": 1, "a": datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc)}
+    with json_app.app_context():
+        body = json_app.json.response(payload).get_data(as_text=True)
+    assert body == '{"a":"Fri, 02 Jan 2026 03:04:05 GMT","b":1}\n'
+
+
+def test_stdlib_only_options_fall_back(json_app):
+    assert json_app.json.dumps({"a": 1}, indent=4) == json.dumps(
+        {"a": 1}, indent=4, sort_keys=True
+    )
+
+
+def test_loads_round_trip(json_app):
+    assert json_app.json.loads(b'{"k": [1, 2]}') == {"k": [1, 2]}